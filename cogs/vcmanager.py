@@ -1,14 +1,18 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Optional, List, Tuple
-from dataclasses import dataclass
+from typing import Optional, List, Set, Tuple, Dict
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
 import asyncio
 import sys
 import os
 import logging
+import time
 import traceback
+import unicodedata
 import math
+from itertools import islice
 from datetime import datetime, timedelta
 from discord.errors import HTTPException, RateLimited, NotFound
 
@@ -31,6 +35,42 @@ async def send_interaction_error(interaction: discord.Interaction, message: str
     except Exception as send_err:
         logger.error(f"エラー通知に失敗しました: {send_err}")
 
+
+def count_pages(count: int, page_size: int = 24) -> int:
+    """件数からページ数を計算（切り上げ、0件なら0ページ）"""
+    return -(-count // page_size)
+
+
+def is_member_in_vc(member: discord.Member, vc: discord.VoiceChannel) -> bool:
+    """メンバーがVCに参加しているか（vc.membersを走査せずボイス状態で判定）"""
+    voice = member.voice
+    return voice is not None and voice.channel is not None and voice.channel.id == vc.id
+
+
+def normalize_screen_id(screen_id: str) -> str:
+    """スクリーンIDの比較用キー（全角・半角や大文字・小文字の違いを吸収）"""
+    return unicodedata.normalize("NFKC", screen_id).casefold()
+
+
+def pick_screen_id_match(members: List[discord.Member], screen_id: str) -> Optional[discord.Member]:
+    """正規化キーが同じメンバーから入力に当たる1人を選ぶ（完全一致を優先し、1人に決まらなければNone）"""
+    exact = [member for member in members if member.name == screen_id]
+    if exact:
+        return exact[0] if len(exact) == 1 else None
+    return members[0] if len(members) == 1 else None
+
+
+def unindex_screen_id(index: dict, key: str, member_id: int) -> bool:
+    """スクリーンID索引からメンバーを外す（載っていた場合はTrue）"""
+    member_ids = index.get(key)
+    if not member_ids or member_id not in member_ids:
+        return False
+    member_ids.remove(member_id)
+    if not member_ids:
+        del index[key]
+    return True
+
+
 class VCType:
     """VCのタイプ定数"""
     NO_LIMIT = "人数指定なし"
@@ -63,10 +103,11 @@ class VCLocationMode:
     UNDER_HUB = "ハブVCの下"
 
 async def retry_on_rate_limit(coro, max_retries=5):
-    """レート制限時に自動リトライする"""
+    """レート制限時に自動リトライする（coroutineを返す関数を渡すと試行ごとに作り直す）"""
     for attempt in range(max_retries):
         try:
-            return await coro
+            # awaitし終えたcoroutineは再利用できないので、関数なら毎回呼び出して作る
+            return await (coro() if callable(coro) else coro)
         except RateLimited as e:
             if attempt < max_retries - 1:
                 wait_time = e.retry_after
@@ -89,6 +130,13 @@ async def retry_on_rate_limit(coro, max_retries=5):
 class VCManager(commands.Cog):
     """VC自動管理システム"""
     
+    # 同時に実行するVC管理システム作成の上限
+    max_concurrent_vc_creates = 4
+    # VC名変更をまとめるまでの待ち時間（秒）
+    rename_debounce_seconds = 3.0
+    # アクティブVCの変更をまとめてデータベースへ書き込むまでの待ち時間（秒）
+    active_vc_save_delay = 2.0
+    
     def __init__(self, bot):
         self.bot = bot
         # {guild_id: {category_id: {'hub_vc_id': id, 'vc_type': type, 'user_limit': int, 'allowed_roles': [], 'location_mode': str, 'target_category_id': id}}}
@@ -100,14 +148,70 @@ class VCManager(commands.Cog):
         # 排他制御用ロック
         self.vc_creation_locks = {}  # {user_id: asyncio.Lock}
         self.db_lock = asyncio.Lock()  # データベース書き込み用
+        self.vc_transfer_locks: dict[int, asyncio.Lock] = {}  # {vc_id: asyncio.Lock} 管理者譲渡用
+        self._vc_create_sem = asyncio.Semaphore(self.max_concurrent_vc_creates)  # VC管理システム作成の同時実行数制限
+        self._inflight_creates: Set[Tuple[int, int]] = set()  # 作成処理中の(guild_id, user_id)
+        self._rename_queues: dict[int, asyncio.Queue] = {}  # {vc_id: VC名変更待ちキュー}
+        self._name_index: dict[int, dict[str, List[int]]] = {}  # {guild_id: {正規化スクリーンID: [member_id, ...]}}
+        self._background_tasks: Set[asyncio.Task] = set()  # 完了を待たない送信処理（参照を保持してGCされないように）
         self.delayed_delete_tasks: dict[int, asyncio.Task] = {}
+        # 保存待ちのアクティブVC（_save_loopがまとめて書き込む）
+        self._dirty_vcs: Set[int] = set()
+        self._save_event = asyncio.Event()
+        self._save_task: Optional[asyncio.Task] = None
+        # VC名クイック編集ビュー（全VCで1つを共有する永続ビュー、cog_loadで登録）
+        self.name_quick_edit_view: Optional[VCNameQuickEditView] = None
         # Bot起動時にデータを復元
         self.bot.loop.create_task(self.restore_from_database())
     
+    async def cog_load(self):
+        """永続ビューを登録（再起動前に送ったボタンもそのまま使える）"""
+        self.name_quick_edit_view = VCNameQuickEditView(self)
+        self.bot.add_view(self.name_quick_edit_view)
+        self._save_task = asyncio.create_task(self._save_loop())
+    
+    async def cog_unload(self):
+        """保存待ちのアクティブVCを書き込んでから終了"""
+        if self._save_task:
+            self._save_task.cancel()
+        await self._flush_active_vcs()
+    
+    def _mark_active_vc_dirty(self, vc_id: int):
+        """アクティブVCの変更をデータベースへの保存待ちにする"""
+        self._dirty_vcs.add(vc_id)
+        self._save_event.set()
+    
+    async def _save_loop(self):
+        """保存待ちのアクティブVCを一定時間ごとにまとめて書き込む"""
+        while True:
+            await self._save_event.wait()
+            # 続けて起きる変更を待ってから1回で書き込む
+            await asyncio.sleep(self.active_vc_save_delay)
+            self._save_event.clear()
+            await self._flush_active_vcs()
+    
+    async def _flush_active_vcs(self):
+        """保存待ちのアクティブVCをデータベースに書き込む（排他制御）"""
+        dirty_vcs, self._dirty_vcs = self._dirty_vcs, set()
+        async with self.db_lock:
+            for vc_id in dirty_vcs:
+                vc_data = self.active_vcs.get(vc_id)
+                if vc_data is None:
+                    # 保存前に削除されたVC
+                    continue
+                try:
+                    self.db.save_active_vc(vc_id, vc_data)
+                except Exception as e:
+                    logger.error(f"❌ データベース保存エラー (VC ID: {vc_id}): {e}")
+    
     async def restore_from_database(self):
         """データベースからVCシステムとアクティブVCを復元"""
         await self.bot.wait_until_ready()
         
+        # スクリーンIDの索引を先に作っておく（最初の操作で全メンバーを走査しないように）
+        for guild in self.bot.guilds:
+            self._build_name_index(guild)
+        
         # VCシステムを復元
         systems = self.db.get_vc_systems()
         restored_count = 0
@@ -151,7 +255,7 @@ class VCManager(commands.Cog):
                 'hidden_roles': system.get('hidden_roles', []),
                 'location_mode': system['location_mode'],
                 'target_category_id': system['target_category_id'],
-                'options': system.get('options', []),
+                'options': frozenset(system.get('options', [])),  # 参加のたびに判定するので集合で保持
                 'locked_name': system.get('locked_name'),
                 'notify_enabled': system.get('notify_enabled', False),
                 'notify_channel_id': system.get('notify_channel_id'),
@@ -173,6 +277,10 @@ class VCManager(commands.Cog):
                 except (ValueError, TypeError):
                     logger.warning(f"無効なdelete_delay_minutes値 (VC ID: {vc_id}): {data['delete_delay_minutes']}")
                     data['delete_delay_minutes'] = None
+            # オプションとユーザーリストは判定用に集合で保持
+            data['options'] = frozenset(data.get('options', []))
+            for key in ('banned_users', 'allowed_users', 'view_allowed_users'):
+                data[key] = set(data.get(key, []))
             # VCがまだ存在するか確認
             found = False
             for guild in self.bot.guilds:
@@ -208,6 +316,130 @@ class VCManager(commands.Cog):
             logger.error(f"VCコマンドエラー: {e}")
             await interaction.response.send_message("❌ エラー", ephemeral=True)
     
+    def _resolve_user_members(self, vc: discord.VoiceChannel, key: str) -> List[discord.Member]:
+        """active_vcsのユーザーID集合をMemberに解決（IDが変わるまで結果を使い回す）"""
+        vc_data = self.active_vcs[vc.id]
+        user_ids = vc_data.get(key, set())
+        cache_key = f'_{key}_members'
+        members = vc_data.get(cache_key)
+        if members is None or members.keys() != user_ids:
+            # 見つからないユーザーは入れない（ID集合と一致しないので次回も解決し直す）
+            members = {}
+            for user_id in user_ids:
+                member = vc.guild.get_member(user_id)
+                if member:
+                    members[user_id] = member
+            vc_data[cache_key] = members
+        return list(members.values())
+    
+    def _invalidate_resolved_members(self, member_id: int):
+        """メンバーを含む解決済みのMemberキャッシュを破棄する（入退室時）"""
+        for vc_data in self.active_vcs.values():
+            for key in ('allowed_users', 'banned_users'):
+                if member_id in vc_data.get(key, ()):
+                    vc_data.pop(f'_{key}_members', None)
+    
+    async def _apply_overwrites(self, vc: discord.VoiceChannel, overwrites: dict):
+        """権限に変更がある場合だけvc.editで反映する"""
+        if overwrites != vc.overwrites:
+            await vc.edit(overwrites=overwrites)
+    
+    @asynccontextmanager
+    async def _pending_overwrites(self, vc: discord.VoiceChannel):
+        """権限の変更をまとめ、変更があった場合だけ1回のeditで反映する"""
+        # vc.overwritesはアクセスのたびに新しいdictを返すので、コピーせずにそのまま編集してよい
+        overwrites = vc.overwrites
+        yield overwrites
+        # 値をその場で書き換えることもあるので、比較はvc.overwritesを取り直して行う
+        if overwrites != vc.overwrites:
+            await vc.edit(overwrites=overwrites)
+    
+    def _build_name_index(self, guild: discord.Guild) -> dict[str, List[int]]:
+        """ギルドのスクリーンID索引を作り直す（キーはnormalize_screen_idで正規化）"""
+        # 正規化すると同じになるメンバー（大文字・小文字違いや旧形式のユーザー名）は同じキーにまとめる
+        index: dict[str, List[int]] = {}
+        for m in guild.members:
+            index.setdefault(normalize_screen_id(m.name), []).append(m.id)
+        self._name_index[guild.id] = index
+        return index
+    
+    def _find_by_screen_id(self, guild: discord.Guild, screen_id: str) -> Optional[discord.Member]:
+        """スクリーンID（name）からメンバーを取得（ギルドごとの索引を使う）"""
+        key = normalize_screen_id(screen_id)
+        index = self._name_index.get(guild.id)
+        if index is None:
+            index = self._build_name_index(guild)
+        member_ids = index.get(key)
+        if not member_ids:
+            return None
+        members = [guild.get_member(member_id) for member_id in member_ids]
+        if not all(member is not None and normalize_screen_id(member.name) == key for member in members):
+            # 索引が古くなっていた場合は作り直して引き直す
+            index = self._build_name_index(guild)
+            members = [guild.get_member(member_id) for member_id in index.get(key, [])]
+        return pick_screen_id_match([member for member in members if member is not None], screen_id)
+    
+    async def _search_by_screen_id(self, guild: discord.Guild, screen_id: str) -> Optional[discord.Member]:
+        """スクリーンID（name）からメンバーを取得（キャッシュに無ければDiscordのメンバー検索を使う）"""
+        member = self._find_by_screen_id(guild, screen_id)
+        if member is not None:
+            return member
+        key = normalize_screen_id(screen_id)
+        index = self._name_index.get(guild.id)
+        if index is not None and index.get(key):
+            # キャッシュ内に候補がいて1人に決まらなかった場合は、検索しても決まらないので見つからない扱い
+            return None
+        try:
+            candidates = await guild.query_members(query=screen_id, limit=5, cache=True)
+        except (asyncio.TimeoutError, discord.ClientException) as e:
+            logger.warning(f"⚠️ メンバー検索エラー (Guild: {guild.id}): {e}")
+            return None
+        matches = [m for m in candidates if normalize_screen_id(m.name) == key]
+        # 検索で見つかったメンバーは索引にも載せておく
+        if matches and index is not None:
+            member_ids = index.setdefault(key, [])
+            member_ids.extend(m.id for m in matches if m.id not in member_ids)
+        return pick_screen_id_match(matches, screen_id)
+    
+    def _send_in_background(self, channel: discord.abc.Messageable, content: str):
+        """完了を待たずにメッセージを送信（失敗はログに残す）"""
+        async def send():
+            try:
+                await channel.send(content)
+            except discord.HTTPException as e:
+                logger.warning(f"⚠️ メッセージ送信エラー (Channel: {getattr(channel, 'id', None)}): {e}")
+        
+        task = asyncio.create_task(send())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        index = self._name_index.get(member.guild.id)
+        if index is not None:
+            member_ids = index.setdefault(normalize_screen_id(member.name), [])
+            if member.id not in member_ids:
+                member_ids.append(member.id)
+        self._invalidate_resolved_members(member.id)
+    
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        index = self._name_index.get(member.guild.id)
+        if index is not None:
+            unindex_screen_id(index, normalize_screen_id(member.name), member.id)
+        self._invalidate_resolved_members(member.id)
+    
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        """スクリーンIDの変更を索引に反映"""
+        before_key = normalize_screen_id(before.name)
+        after_key = normalize_screen_id(after.name)
+        if before_key == after_key:
+            return
+        for index in self._name_index.values():
+            if unindex_screen_id(index, before_key, after.id):
+                index.setdefault(after_key, []).append(after.id)
+    
     @commands.Cog.listener()
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
         """VC参加・退出時の処理"""
@@ -420,6 +652,45 @@ class VCManager(commands.Cog):
             logger.warning(f"メッセージ送信に失敗しました (Channel ID: {channel.id}): {e}")
         return None
     
+    def queue_vc_rename(self, vc: discord.VoiceChannel, new_name: str, interaction: discord.Interaction):
+        """VC名変更をチャンネルごとのキューに積む（処理はチャンネルごとのワーカーが順番に行う）"""
+        queue = self._rename_queues.get(vc.id)
+        if queue is None:
+            queue = self._rename_queues[vc.id] = asyncio.Queue()
+            task = asyncio.create_task(self._rename_worker(vc, queue))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        queue.put_nowait((new_name, interaction))
+    
+    async def _rename_worker(self, vc: discord.VoiceChannel, queue: asyncio.Queue):
+        """キューに溜まったVC名変更をまとめて処理（最新の名前だけを反映）"""
+        try:
+            while not queue.empty():
+                # 連続した変更をまとめるため少し待ってから処理する
+                await asyncio.sleep(self.rename_debounce_seconds)
+                pending = []
+                while not queue.empty():
+                    pending.append(queue.get_nowait())
+                new_name = pending[-1][0]
+                
+                try:
+                    await vc.edit(name=new_name)
+                    message = f"VC名を「{new_name}」に変更しました"
+                except RateLimited as e:
+                    message = f"VC名の変更が制限されています。{math.ceil(e.retry_after)}秒後にもう一度お試しください"
+                except Exception as e:
+                    logger.warning(f"VC名変更エラー (VC ID: {vc.id}): {e}")
+                    message = f"エラーが発生しました: {str(e)}"
+                
+                # まとめて処理した全員に結果を通知
+                for _, interaction in pending:
+                    try:
+                        await interaction.followup.send(message, ephemeral=True)
+                    except HTTPException as e:
+                        logger.debug(f"VC名変更結果の通知に失敗しました (VC ID: {vc.id}): {e}")
+        finally:
+            self._rename_queues.pop(vc.id, None)
+    
     async def _create_and_move_user_impl(self, member: discord.Member, hub_vc: discord.VoiceChannel, system_data: dict):
         """新しいVCを作成してユーザーを移動"""
         vc_type = system_data['vc_type']
@@ -570,10 +841,10 @@ class VCManager(commands.Cog):
         has_hide_full = VCOption.HIDE_FULL in options
         
         # 操作パネルありの場合のみブロックリストを適用
-        banned_users = []
+        banned_users = set()
         if has_control:
             # データベースからブロックリストを読み込み
-            banned_users = self.db.get_banned_users(member.id)
+            banned_users = set(self.db.get_banned_users(member.id))
             
             # ブロックユーザーに対して接続権限を拒否
             if banned_users:
@@ -598,8 +869,8 @@ class VCManager(commands.Cog):
             'owner_id': member.id,
             'banned_users': banned_users,
             'is_locked': False,
-            'allowed_users': [],
-            'view_allowed_users': [],
+            'allowed_users': set(),
+            'view_allowed_users': set(),
             'skip_first_join_log': True,
             'options': options,
             'name_locked': VCOption.LOCK_NAME in options,
@@ -676,19 +947,14 @@ class VCManager(commands.Cog):
                 description="下のボタンから入力してください",
                 color=discord.Color.blue()
             )
-            view = VCNameQuickEditView(new_vc, member, self)
-            msg = await self._safe_channel_send(new_vc, embed=embed, view=view)
+            msg = await self._safe_channel_send(new_vc, embed=embed, view=self.name_quick_edit_view)
             
             # メッセージIDを保存（後で削除するため）
             if msg:
                 self.active_vcs[new_vc.id]['name_edit_message_id'] = msg.id
         
-        # データベースに保存（排他制御）
-        async with self.db_lock:
-            try:
-                self.db.save_active_vc(new_vc.id, self.active_vcs[new_vc.id])
-            except Exception as e:
-                logger.error(f"❌ データベース保存エラー (VC ID: {new_vc.id}): {e}")
+        # データベースに保存（_save_loopがまとめて書き込む）
+        self._mark_active_vc_dirty(new_vc.id)
     
     async def create_text_channel_for_vc(self, vc: discord.VoiceChannel, owner: discord.Member, guild: discord.Guild):
         """VCに紐づくテキストチャンネルを作成"""
@@ -889,74 +1155,82 @@ class VCManager(commands.Cog):
             logger.info(f"管理者譲渡なしオプションが有効なため、権限引継ぎをスキップします (VC: {vc.name})")
             return
         
-        # VC内のBOT以外のメンバーを取得
-        non_bot_members = [m for m in vc.members if not m.bot]
-        
-        if len(non_bot_members) == 0:
-            # 誰もいない場合は何もしない（削除処理が実行される）
-            return
-        
-        # 次の管理者（最初に参加した人）
-        new_owner = non_bot_members[0]
-        
-        # オーナーIDを更新
-        self.active_vcs[vc.id]['owner_id'] = new_owner.id
-        
-        # 新しい管理者のブロックリストを読み込み、VCの権限に適用
-        new_owner_banned_users = self.db.get_banned_users(new_owner.id)
-        self.active_vcs[vc.id]['banned_users'] = new_owner_banned_users
-        
-        # 現在のVCメンバーを精査し、ブロックユーザーを切断
-        for member_in_vc in vc.members:
-            if not member_in_vc.bot and member_in_vc.id in new_owner_banned_users:
-                try:
-                    await member_in_vc.move_to(None)  # VCから切断
-                    logger.info(f"✅ ブロックユーザー {member_in_vc.display_name} をVC {vc.name} から切断しました。")
-                except discord.HTTPException as e:
-                    logger.warning(f"⚠️ ブロックユーザー {member_in_vc.display_name} の切断に失敗しました: {e}")
-        
-        # VCの権限を更新してブロックリストを反映
-        current_overwrites = vc.overwrites
-        for banned_user_id in new_owner_banned_users:
-            banned_member = vc.guild.get_member(banned_user_id)
-            if banned_member:
-                current_overwrites[banned_member] = discord.PermissionOverwrite(connect=False)
-        
-        try:
-            await vc.edit(overwrites=current_overwrites)
-            logger.info(f"✅ VC {vc.name} の権限を更新し、新しい管理者のブロックリストを適用しました。")
-        except discord.HTTPException as e:
-            logger.error(f"❌ VC {vc.name} の権限更新に失敗しました: {e}")
-        
-        # 操作パネルありの場合のみ、操作チャンネルを作り直す
-        options = self.active_vcs[vc.id].get('options', [])
-        has_control = VCOption.NO_CONTROL not in options
-        
-        if has_control:
-            # 操作チャンネルを削除
-            control_channel_id = self.active_vcs[vc.id].get('control_channel_id')
-            if control_channel_id:
-                control_channel = vc.guild.get_channel(control_channel_id)
-                if control_channel:
+        # 手動の譲渡（VCOwnershipTransferModal）と重ならないように、VCごとのロックの中で引き継ぐ
+        async with self.vc_transfer_locks.setdefault(vc.id, asyncio.Lock()):
+            # ロック待ちの間にVCが削除されたか、手動で譲渡済みなら何もしない
+            if vc.id not in self.active_vcs or self.active_vcs[vc.id]['owner_id'] != old_owner.id:
+                return
+            
+            # VC内のBOT以外のメンバーを取得
+            non_bot_members = [m for m in vc.members if not m.bot]
+            
+            if len(non_bot_members) == 0:
+                # 誰もいない場合は何もしない（削除処理が実行される）
+                return
+            
+            # 次の管理者（最初に参加した人）
+            new_owner = non_bot_members[0]
+            
+            # オーナーIDを更新
+            self.active_vcs[vc.id]['owner_id'] = new_owner.id
+            
+            # 新しい管理者のブロックリストを読み込み、VCの権限に適用
+            new_owner_banned_users = set(self.db.get_banned_users(new_owner.id))
+            self.active_vcs[vc.id]['banned_users'] = new_owner_banned_users
+            self._mark_active_vc_dirty(vc.id)
+            
+            # 現在のVCメンバーを精査し、ブロックユーザーを切断
+            for member_in_vc in vc.members:
+                if not member_in_vc.bot and member_in_vc.id in new_owner_banned_users:
                     try:
-                        await control_channel.delete()
+                        await member_in_vc.move_to(None)  # VCから切断
+                        logger.info(f"✅ ブロックユーザー {member_in_vc.display_name} をVC {vc.name} から切断しました。")
                     except discord.HTTPException as e:
-                        logger.warning(f"⚠️ 操作チャンネル削除エラー (ID: {control_channel.id}): {e}")
+                        logger.warning(f"⚠️ ブロックユーザー {member_in_vc.display_name} の切断に失敗しました: {e}")
             
-            # 新しい操作チャンネルを作成
-            system_data = self.active_vcs[vc.id].get('system_data', {})
-            control_category_id = system_data.get('control_category_id')
-            target_category = None
-            if control_category_id:
-                target_category = vc.guild.get_channel(control_category_id)
-                if not isinstance(target_category, discord.CategoryChannel):
-                    target_category = None
+            # VCの権限を更新してブロックリストを反映
+            current_overwrites = vc.overwrites
+            for banned_user_id in new_owner_banned_users:
+                banned_member = vc.guild.get_member(banned_user_id)
+                if banned_member:
+                    current_overwrites[banned_member] = discord.PermissionOverwrite(connect=False)
+            
+            try:
+                await vc.edit(overwrites=current_overwrites)
+                logger.info(f"✅ VC {vc.name} の権限を更新し、新しい管理者のブロックリストを適用しました。")
+            except discord.HTTPException as e:
+                logger.error(f"❌ VC {vc.name} の権限更新に失敗しました: {e}")
             
-            new_control_channel = await self.create_control_channel_for_vc(vc, new_owner, vc.guild, target_category)
-            self.active_vcs[vc.id]['control_channel_id'] = new_control_channel.id
+            # 操作パネルありの場合のみ、操作チャンネルを作り直す
+            options = self.active_vcs[vc.id].get('options', [])
+            has_control = VCOption.NO_CONTROL not in options
             
-            # 新しい操作パネルを送信
-            await self.send_control_panel(vc, new_control_channel, new_owner)
+            if has_control:
+                # 操作チャンネルを削除
+                control_channel_id = self.active_vcs[vc.id].get('control_channel_id')
+                if control_channel_id:
+                    control_channel = vc.guild.get_channel(control_channel_id)
+                    if control_channel:
+                        try:
+                            await control_channel.delete()
+                        except discord.HTTPException as e:
+                            logger.warning(f"⚠️ 操作チャンネル削除エラー (ID: {control_channel.id}): {e}")
+                
+                # 新しい操作チャンネルを作成
+                system_data = self.active_vcs[vc.id].get('system_data', {})
+                control_category_id = system_data.get('control_category_id')
+                target_category = None
+                if control_category_id:
+                    target_category = vc.guild.get_channel(control_category_id)
+                    if not isinstance(target_category, discord.CategoryChannel):
+                        target_category = None
+                
+                new_control_channel = await self.create_control_channel_for_vc(vc, new_owner, vc.guild, target_category)
+                self.active_vcs[vc.id]['control_channel_id'] = new_control_channel.id
+                self._mark_active_vc_dirty(vc.id)
+                
+                # 新しい操作パネルを送信
+                await self.send_control_panel(vc, new_control_channel, new_owner)
     
     async def check_and_hide_if_full(self, vc: discord.VoiceChannel):
         """満員の場合、チャンネルを非表示にする"""
@@ -1053,6 +1327,7 @@ class VCManager(commands.Cog):
             if vc_type == VCType.WITH_LIMIT:
                 bot_count += 1
                 vc_data['bot_count'] = bot_count
+                self._mark_active_vc_dirty(channel.id)
                 new_limit = original_limit + bot_count
 
                 # Discord の制限と下限をガード
@@ -1099,6 +1374,7 @@ class VCManager(commands.Cog):
             if vc_type == VCType.WITH_LIMIT and bot_count > 0:
                 bot_count -= 1
                 vc_data['bot_count'] = bot_count
+                self._mark_active_vc_dirty(channel.id)
                 new_limit = original_limit + bot_count
 
                 # user_limitが0未満にならないようガード
@@ -1189,6 +1465,8 @@ class VCManager(commands.Cog):
             
             # メモリから削除
             del self.active_vcs[channel.id]
+            self._dirty_vcs.discard(channel.id)
+            self.vc_transfer_locks.pop(channel.id, None)
             self._cancel_delayed_delete_task(channel.id)
             logger.info(f"✅ VC削除完了 (ID: {channel.id})")
             
@@ -1198,16 +1476,33 @@ class VCManager(commands.Cog):
             print(f"❌ VC削除エラー: {e}")
             # エラーでもクラッシュしない
     
-    async def create_vc_system(self, guild: discord.Guild, vc_type: str, user_limit: int, hub_role_ids: List[int], vc_role_ids: List[int], hidden_role_ids: List[int], location_mode: str, target_category_id: Optional[int], source_channel, options: List[str], locked_name: Optional[str] = None, control_category_id: Optional[int] = None, notify_enabled: bool = False, notify_channel_id: Optional[int] = None, notify_category_id: Optional[int] = None, notify_role_id: Optional[int] = None, notify_category_new: bool = False, control_category_new: bool = False, delete_delay_minutes: Optional[int] = None):
-        """VC管理システムを作成"""
+    async def create_vc_system(self, guild: discord.Guild, vc_type: str, user_limit: int, hub_role_ids: List[int], vc_role_ids: List[int], hidden_role_ids: List[int], location_mode: str, target_category_id: Optional[int], source_channel, options: List[str], locked_name: Optional[str] = None, control_category_id: Optional[int] = None, notify_enabled: bool = False, notify_channel_id: Optional[int] = None, notify_category_id: Optional[int] = None, notify_role_id: Optional[int] = None, notify_category_new: bool = False, control_category_new: bool = False, delete_delay_minutes: Optional[int] = None, requested_by: Optional[int] = None):
+        """VC管理システムを作成（作成したハブVCを返す。requested_byのユーザーの作成処理が実行中ならNone）"""
+        # 同じユーザーの作成処理が実行中なら重複して作成しない（ボタンの連打や複数のセットアップ画面から）
+        key = (guild.id, requested_by)
+        if requested_by is not None:
+            if key in self._inflight_creates:
+                logger.info(f"VC管理システム作成が実行中のためスキップ (Guild: {guild.name}, User ID: {requested_by})")
+                return None
+            self._inflight_creates.add(key)
         try:
-            logger.info(f"🚀 VC管理システム作成開始 (Guild: {guild.name}, Type: {vc_type})")
-            await self._create_vc_system_impl(guild, vc_type, user_limit, hub_role_ids, vc_role_ids, hidden_role_ids, location_mode, target_category_id, source_channel, options, locked_name, control_category_id, notify_enabled, notify_channel_id, notify_category_id, notify_role_id, notify_category_new, control_category_new, delete_delay_minutes)
-            logger.info(f"✅ VC管理システム作成完了 (Guild: {guild.name})")
-        except Exception as e:
-            logger.error(f"❌ VC管理システム作成エラー (Guild: {guild.name}): {e}")
-            logger.error(traceback.format_exc())
-            raise
+            wait_started = time.monotonic()
+            async with self._vc_create_sem:
+                waited = time.monotonic() - wait_started
+                if waited > 0.5:
+                    logger.info(f"VC管理システム作成の順番待ち: {waited:.2f}秒 (Guild: {guild.name})")
+                try:
+                    logger.info(f"🚀 VC管理システム作成開始 (Guild: {guild.name}, Type: {vc_type})")
+                    _, hub_vc = await self._create_vc_system_impl(guild, vc_type, user_limit, hub_role_ids, vc_role_ids, hidden_role_ids, location_mode, target_category_id, source_channel, options, locked_name, control_category_id, notify_enabled, notify_channel_id, notify_category_id, notify_role_id, notify_category_new, control_category_new, delete_delay_minutes)
+                    logger.info(f"✅ VC管理システム作成完了 (Guild: {guild.name})")
+                except Exception as e:
+                    logger.error(f"❌ VC管理システム作成エラー (Guild: {guild.name}): {e}")
+                    logger.error(traceback.format_exc())
+                    raise
+        finally:
+            if requested_by is not None:
+                self._inflight_creates.discard(key)
+        return hub_vc
     
     async def _create_vc_system_impl(self, guild: discord.Guild, vc_type: str, user_limit: int, hub_role_ids: List[int], vc_role_ids: List[int], hidden_role_ids: List[int], location_mode: str, target_category_id: Optional[int], source_channel, options: List[str], locked_name: Optional[str] = None, control_category_id: Optional[int] = None, notify_enabled: bool = False, notify_channel_id: Optional[int] = None, notify_category_id: Optional[int] = None, notify_role_id: Optional[int] = None, notify_category_new: bool = False, control_category_new: bool = False, delete_delay_minutes: Optional[int] = None):
         """VC管理システムを作成（内部実装）"""
@@ -1344,7 +1639,7 @@ class VCManager(commands.Cog):
             'hidden_roles': hidden_role_ids if hidden_role_ids else [],
             'location_mode': location_mode,
             'target_category_id': vc_target_category_id,
-            'options': options,
+            'options': frozenset(options),  # 参加のたびに判定するので集合で保持
             'locked_name': locked_name,
             'control_category_id': control_category_id,
             'delete_delay_minutes': delete_delay_minutes,
@@ -1405,9 +1700,9 @@ class VCSetupView(discord.ui.View):
         self.user = user
         self.source_channel = source_channel
         self.guild = guild
-        self.hub_role_ids = []  # ハブVCに入れるロール
-        self.vc_role_ids = []   # 作成されたVCに入れるロール
-        self.hidden_role_ids = []  # VCを見えなくするロール
+        self.hub_role_ids = set()  # ハブVCに入れるロール
+        self.vc_role_ids = set()   # 作成されたVCに入れるロール
+        self.hidden_role_ids = set()  # VCを見えなくするロール
         self.hub_role_mode = "none"  # ハブVCロール制限モード
         self.vc_role_mode = "none"   # 作成VCロール制限モード
         self.hidden_role_mode = "none"  # 閲覧可能ロールモード
@@ -1417,6 +1712,14 @@ class VCSetupView(discord.ui.View):
         self.target_category_id = None
         self.selected_options = []
         self.locked_name = None
+        # 選択可能なロール一覧とページ数（ロール選択画面で使い回す）
+        self._cached_roles: Optional[Tuple[Tuple[discord.Role, ...], int]] = None
+        # ドロップダウン表示用に短くしたロール名（ロールID → 名前）
+        self._role_short_names: dict = {}
+        # ドロップダウンのvalueに使うロールID文字列（ロールID → 文字列）
+        self._role_option_values: dict = {}
+        # 再描画ごとに Embed を作り直さないようテンプレートを保持
+        self._settings_embed_template = discord.Embed(title="🎭 VC管理システム セットアップ", color=0x5865F2)
         
         # ハブVCロール制限選択
         self.add_item(HubRoleModeDropdown(self))
@@ -1474,7 +1777,36 @@ class VCSetupView(discord.ui.View):
         if not settings:
             return "未選択（デフォルト設定で進みます）"
         
-        return "\n".join([f"✓ {s}" for s in settings])
+        return "\n".join(f"✓ {s}" for s in settings)
+    
+    def get_cached_roles(self, guild: discord.Guild) -> Tuple[Tuple[discord.Role, ...], int]:
+        """選択可能なロール（@everyone以外）と24個ずつのページ数を取得（初回のみ計算）"""
+        if self._cached_roles is None:
+            # @everyone のロールIDはサーバーIDと同じなので整数比較で除外する
+            everyone_id = guild.id
+            roles = tuple(r for r in guild.roles if r.id != everyone_id)
+            self._cached_roles = (roles, count_pages(len(roles)))
+        return self._cached_roles
+    
+    def short_role_name(self, role: discord.Role) -> str:
+        """ドロップダウン表示用のロール名（20文字まで）を取得"""
+        name = self._role_short_names.get(role.id)
+        if name is None:
+            name = self._role_short_names[role.id] = role.name[:20]
+        return name
+    
+    def role_option_value(self, role: discord.Role) -> str:
+        """ドロップダウンのvalueに使うロールID文字列を取得"""
+        value = self._role_option_values.get(role.id)
+        if value is None:
+            value = self._role_option_values[role.id] = str(role.id)
+        return value
+    
+    def build_settings_embed(self) -> discord.Embed:
+        """現在の設定を表示する埋め込みを作成（テンプレートを複製して説明文だけ差し替える）"""
+        embed = self._settings_embed_template.copy()
+        embed.description = f"```\n【現在の設定】\n{self.get_current_settings_text()}\n```"
+        return embed
     
     async def create_vc_system(self, interaction: discord.Interaction):
         """VC管理システムを作成"""
@@ -1483,22 +1815,26 @@ class VCSetupView(discord.ui.View):
             await interaction.response.defer(ephemeral=True)
         
         # VC管理システムを作成
-        await self.cog.create_vc_system(
+        hub_vc = await self.cog.create_vc_system(
             interaction.guild,
             self.vc_type,
             self.user_limit,
-            self.hub_role_ids,
-            self.vc_role_ids,
-            self.hidden_role_ids,
+            tuple(self.hub_role_ids),
+            tuple(self.vc_role_ids),
+            tuple(self.hidden_role_ids),
             self.location_mode,
             self.target_category_id,
             self.source_channel,
-            self.selected_options,
+            tuple(self.selected_options),
             self.locked_name,
-            control_category_new=False
+            control_category_new=False,
+            requested_by=interaction.user.id
         )
+        if hub_vc is None:
+            await interaction.followup.send("作成処理が実行中です", ephemeral=True)
+            return
         
-        await interaction.followup.send("✅ VC管理システムを作成しました", ephemeral=True)
+        await interaction.followup.send(f"✅ VC管理システムを作成しました: {hub_vc.mention}", ephemeral=True)
         self.stop()
     
     async def finish_creation(self, interaction: discord.Interaction):
@@ -1506,521 +1842,229 @@ class VCSetupView(discord.ui.View):
         await interaction.response.defer(ephemeral=True)
         
         # VC管理システムを作成
-        await self.cog.create_vc_system(
+        hub_vc = await self.cog.create_vc_system(
             interaction.guild,
             self.vc_type,
             self.user_limit,
-            self.hub_role_ids,
-            self.vc_role_ids,
-            self.hidden_role_ids,
+            tuple(self.hub_role_ids),
+            tuple(self.vc_role_ids),
+            tuple(self.hidden_role_ids),
             self.location_mode,
             self.target_category_id,
             self.source_channel,
-            self.selected_options,
+            tuple(self.selected_options),
             self.locked_name,
-            control_category_new=False
+            control_category_new=False,
+            requested_by=interaction.user.id
         )
+        if hub_vc is None:
+            await interaction.followup.send("作成処理が実行中です", ephemeral=True)
+            return
         
-        await interaction.followup.send("✅ VC管理システムを作成しました", ephemeral=True)
+        await interaction.followup.send(f"✅ VC管理システムを作成しました: {hub_vc.mention}", ephemeral=True)
         self.stop()
 
 
 class HubRoleModeDropdown(discord.ui.Select):
     """ハブVCロール制限モード選択ドロップダウン"""
     
+    _OPTIONS = (
+        discord.SelectOption(label="全員入室可能", value="none", description="@everyoneが入れる"),
+        discord.SelectOption(label="ロール限定", value="specify", description="指定したロールのみ入室可能")
+    )
+    
     def __init__(self, parent_view):
         self.parent_view = parent_view
         
-        options = [
-            discord.SelectOption(label="全員入室可能", value="none", description="@everyoneが入れる"),
-            discord.SelectOption(label="ロール限定", value="specify", description="指定したロールのみ入室可能")
-        ]
-        
         super().__init__(
             placeholder="ハブ参加権限ロール",
             min_values=0,
             max_values=1,
-            options=options,
+            options=list(self._OPTIONS),
             row=0
         )
     
     async def callback(self, interaction: discord.Interaction):
+        # 先に応答して3秒制限を回避
+        await interaction.response.defer()
+        
         # 値を保存
         if len(self.values) > 0:
             self.parent_view._hub_selected = True  # 選択フラグを立てる
             if self.values[0] == "none":
-                self.parent_view.hub_role_ids = []
+                self.parent_view.hub_role_ids = set()
                 self.parent_view.hub_role_mode = "none"
             else:
                 self.parent_view.hub_role_mode = "specify"
         
         # 埋め込みを更新して選択内容を表示
-        settings_text = self.parent_view.get_current_settings_text()
-        embed = discord.Embed(
-            title="🎭 VC管理システム セットアップ",
-            description=f"```\n【現在の設定】\n{settings_text}\n```",
-            color=0x5865F2
-        )
+        embed = self.parent_view.build_settings_embed()
         
         # メッセージを更新
-        await interaction.response.edit_message(embed=embed, view=self.view)
-
-
-class HubRoleSelectView(discord.ui.View):
-    """ハブVCロール選択用のページネーションビュー"""
-    
-    def __init__(self, parent_view: VCSetupView, guild: discord.Guild, page: int = 0):
-        super().__init__(timeout=300)
-        self.parent_view = parent_view
-        self.guild = guild
-        self.page = page
-        
-        # 全ロールを取得
-        self.all_roles = [r for r in guild.roles if r.name != "@everyone" and not r.managed]
-        self.total_pages = (len(self.all_roles) + 23) // 24  # 24個ずつ（1つは完了ボタン用）
-        
-        # 現在のページのロールを表示
-        self.update_components()
-    
-    def update_components(self):
-        """コンポーネントを更新"""
-        self.clear_items()
-        
-        # 現在のページのロールを取得
-        start_idx = self.page * 24
-        end_idx = min(start_idx + 24, len(self.all_roles))
-        page_roles = self.all_roles[start_idx:end_idx]
-        
-        # ロール選択ドロップダウンを追加
-        if len(page_roles) > 0:
-            self.add_item(HubRoleSelectDropdown(self, page_roles, start_idx))
-        
-        # ページネーションボタン
-        if self.total_pages > 1:
-            if self.page > 0:
-                prev_btn = discord.ui.Button(label="◀ 前のページ", style=discord.ButtonStyle.gray, row=1)
-                prev_btn.callback = self.prev_page
-                self.add_item(prev_btn)
-            
-            page_info_btn = discord.ui.Button(
-                label=f"{self.page + 1} / {self.total_pages}ページ",
-                style=discord.ButtonStyle.secondary,
-                disabled=True,
-                row=1
-            )
-            self.add_item(page_info_btn)
-            
-            if self.page < self.total_pages - 1:
-                next_btn = discord.ui.Button(label="次のページ ▶", style=discord.ButtonStyle.gray, row=1)
-                next_btn.callback = self.next_page
-                self.add_item(next_btn)
-        
-        # 完了ボタン
-        done_btn = discord.ui.Button(
-            label=f"✅ 選択完了 ({len(self.parent_view.hub_role_ids)}個)",
-            style=discord.ButtonStyle.green,
-            row=2
-        )
-        done_btn.callback = self.done
-        self.add_item(done_btn)
-        
-        # クリアボタン
-        if len(self.parent_view.hub_role_ids) > 0:
-            clear_btn = discord.ui.Button(label="🗑️ 全解除", style=discord.ButtonStyle.danger, row=2)
-            clear_btn.callback = self.clear_all
-            self.add_item(clear_btn)
-    
-    async def prev_page(self, interaction: discord.Interaction):
-        self.page -= 1
-        self.update_components()
-        await interaction.response.edit_message(view=self)
-    
-    async def next_page(self, interaction: discord.Interaction):
-        self.page += 1
-        self.update_components()
-        await interaction.response.edit_message(view=self)
-    
-    async def done(self, interaction: discord.Interaction):
-        await interaction.response.send_message(
-            f"✅ ハブVCロールを{len(self.parent_view.hub_role_ids)}個選択しました",
-            ephemeral=True
-        )
-        self.stop()
-    
-    async def clear_all(self, interaction: discord.Interaction):
-        self.parent_view.hub_role_ids = []
-        self.update_components()
-        await interaction.response.edit_message(view=self)
-
-
-class HubRoleSelectDropdown(discord.ui.Select):
-    """ハブVCロール選択ドロップダウン"""
-    
-    def __init__(self, role_view: HubRoleSelectView, roles: list, start_idx: int):
-        self.role_view = role_view
-        
-        options = []
-        for role in roles:
-            is_selected = role.id in role_view.parent_view.hub_role_ids
-            # ロール名を短く制限（20文字まで）
-            role_name = role.name[:20] if len(role.name) > 20 else role.name
-            label = f"{'✓ ' if is_selected else ''}{role_name}"
-            options.append(discord.SelectOption(
-                label=label,
-                value=str(role.id)
-            ))
-        
-        super().__init__(
-            placeholder=f"ロールを選択 ({start_idx + 1}～{start_idx + len(roles)})",
-            min_values=0,
-            max_values=len(options),
-            options=options,
-            row=0
-        )
-    
-    async def callback(self, interaction: discord.Interaction):
-        # 選択されたロールIDを取得
-        selected_ids = [int(role_id) for role_id in self.values]
-        
-        # 現在のドロップダウンのロールIDリストを取得
-        current_dropdown_role_ids = [int(opt.value) for opt in self.options]
-        
-        # 現在のドロップダウンのロールを一旦削除
-        self.role_view.parent_view.hub_role_ids = [
-            rid for rid in self.role_view.parent_view.hub_role_ids 
-            if rid not in current_dropdown_role_ids
-        ]
-        
-        # 新しく選択されたロールを追加
-        self.role_view.parent_view.hub_role_ids.extend(selected_ids)
-        
-        # 選択フラグを立てる
-        self.role_view.has_selected = True
-        
-        # 次へボタンを有効化
-        self.role_view.next_btn.disabled = False
-        self.role_view.next_btn.style = discord.ButtonStyle.green
-        
-        # 選択されたロール名を取得
-        selected_role_names = []
-        for role_id in self.role_view.parent_view.hub_role_ids:
-            role = self.role_view.guild.get_role(role_id)
-            if role:
-                selected_role_names.append(role.name)
-        
-        # 埋め込みに選択内容を表示
-        if selected_role_names:
-            roles_text = "\n".join([f"✓ {name[:30]}" for name in selected_role_names[:5]])  # 最大5個、30文字まで
-            if len(selected_role_names) > 5:
-                roles_text += f"\n\n... その他 {len(selected_role_names) - 5}個のロール"
-            
-            embed = discord.Embed(
-                title="🎭 ハブ参加権限ロール",
-                description=f"```\nハブVCに入室できるロールを指定します\n\n【選択中のロール】\n{roles_text}\n```",
-                color=0x5865F2
-            )
-        else:
-            embed = discord.Embed(
-                title="🎭 ハブ参加権限ロール",
-                description="```\nハブVCに入室できるロールを指定します\n\nドロップダウンからロールを選択してください\n```",
-                color=0x5865F2
-            )
-        
-        # ビューを更新（edit_messageを使う）
-        await interaction.response.edit_message(embed=embed, view=self.role_view)
+        await interaction.edit_original_response(embed=embed, view=self.view)
 
 
 class VCRoleModeDropdown(discord.ui.Select):
     """作成されたVCロール制限モード選択ドロップダウン"""
     
+    _OPTIONS = (
+        discord.SelectOption(label="全員入室可能", value="none", description="@everyoneが入れる"),
+        discord.SelectOption(label="ロール限定", value="specify", description="指定したロールのみ入室可能")
+    )
+    
     def __init__(self, parent_view):
         self.parent_view = parent_view
         
-        options = [
-            discord.SelectOption(label="全員入室可能", value="none", description="@everyoneが入れる"),
-            discord.SelectOption(label="ロール限定", value="specify", description="指定したロールのみ入室可能")
-        ]
-        
         super().__init__(
             placeholder="VC参加権限ロール",
             min_values=0,
             max_values=1,
-            options=options,
+            options=list(self._OPTIONS),
             row=1
         )
     
     async def callback(self, interaction: discord.Interaction):
+        # 先に応答して3秒制限を回避
+        await interaction.response.defer()
+        
         # 値を保存
         if len(self.values) > 0:
             self.parent_view._vc_selected = True  # 選択フラグを立てる
             if self.values[0] == "none":
-                self.parent_view.vc_role_ids = []
+                self.parent_view.vc_role_ids = set()
                 self.parent_view.vc_role_mode = "none"
             else:
                 self.parent_view.vc_role_mode = "specify"
         
         # 埋め込みを更新して選択内容を表示
-        settings_text = self.parent_view.get_current_settings_text()
-        embed = discord.Embed(
-            title="🎭 VC管理システム セットアップ",
-            description=f"```\n【現在の設定】\n{settings_text}\n```",
-            color=0x5865F2
-        )
+        embed = self.parent_view.build_settings_embed()
         
         # メッセージを更新
-        await interaction.response.edit_message(embed=embed, view=self.view)
+        await interaction.edit_original_response(embed=embed, view=self.view)
 
 
 class HiddenRoleModeDropdown(discord.ui.Select):
     """閲覧可能ロール選択ドロップダウン"""
     
+    _OPTIONS = (
+        discord.SelectOption(label="全員閲覧可能", value="none", description="@everyoneが見える"),
+        discord.SelectOption(label="ロール限定", value="specify", description="指定したロールのみ閲覧可能")
+    )
+    
     def __init__(self, parent_view):
         self.parent_view = parent_view
         
-        options = [
-            discord.SelectOption(label="全員閲覧可能", value="none", description="@everyoneが見える"),
-            discord.SelectOption(label="ロール限定", value="specify", description="指定したロールのみ閲覧可能")
-        ]
-        
         super().__init__(
             placeholder="閲覧可能ロール",
             min_values=0,
             max_values=1,
-            options=options,
+            options=list(self._OPTIONS),
             row=2
         )
     
     async def callback(self, interaction: discord.Interaction):
+        # 先に応答して3秒制限を回避
+        await interaction.response.defer()
+        
         # 値を保存
         if len(self.values) > 0:
             self.parent_view._hidden_selected = True  # 選択フラグを立てる
             if self.values[0] == "none":
-                self.parent_view.hidden_role_ids = []
+                self.parent_view.hidden_role_ids = set()
                 self.parent_view.hidden_role_mode = "none"
             else:
                 self.parent_view.hidden_role_mode = "specify"
         
         # 埋め込みを更新して選択内容を表示
-        settings_text = self.parent_view.get_current_settings_text()
-        embed = discord.Embed(
-            title="🎭 VC管理システム セットアップ",
-            description=f"```\n【現在の設定】\n{settings_text}\n```",
-            color=0x5865F2
-        )
+        embed = self.parent_view.build_settings_embed()
         
         # メッセージを更新
-        await interaction.response.edit_message(embed=embed, view=self.view)
+        await interaction.edit_original_response(embed=embed, view=self.view)
 
 
-class VCRoleSelectView(discord.ui.View):
-    """作成されたVCロール選択用のページネーションビュー"""
+class VCTypeSelectDropdown(discord.ui.Select):
+    """VCタイプ選択ドロップダウン"""
     
-    def __init__(self, parent_view: VCSetupView, guild: discord.Guild, page: int = 0):
-        super().__init__(timeout=300)
+    _OPTIONS = (
+        discord.SelectOption(label=VCType.NO_LIMIT, value=VCType.NO_LIMIT, description="基本のVC"),
+        discord.SelectOption(label=VCType.WITH_LIMIT, value=VCType.WITH_LIMIT, description="人数制限付きVC（1～25人）")
+    )
+    
+    def __init__(self, parent_view: VCSetupView):
         self.parent_view = parent_view
-        self.guild = guild
-        self.page = page
-        
-        # 全ロールを取得
-        self.all_roles = [r for r in guild.roles if r.name != "@everyone" and not r.managed]
-        self.total_pages = (len(self.all_roles) + 23) // 24
         
-        # 現在のページのロールを表示
-        self.update_components()
+        super().__init__(
+            placeholder="人数指定の有無",
+            min_values=0,
+            max_values=1,
+            options=list(self._OPTIONS),
+            row=3
+        )
     
-    def update_components(self):
-        """コンポーネントを更新"""
-        self.clear_items()
+    async def callback(self, interaction: discord.Interaction):
+        # 先に応答して3秒制限を回避
+        await interaction.response.defer()
         
-        # 現在のページのロールを取得
-        start_idx = self.page * 24
-        end_idx = min(start_idx + 24, len(self.all_roles))
-        page_roles = self.all_roles[start_idx:end_idx]
+        if len(self.values) > 0:
+            self.parent_view._type_selected = True  # 選択フラグを立てる
+            self.parent_view.vc_type = self.values[0]
         
-        # ロール選択ドロップダウンを追加
-        if len(page_roles) > 0:
-            self.add_item(VCRoleSelectDropdown(self, page_roles, start_idx))
+        # 埋め込みを更新して選択内容を表示
+        embed = self.parent_view.build_settings_embed()
         
-        # ページネーションボタン
-        if self.total_pages > 1:
-            if self.page > 0:
-                prev_btn = discord.ui.Button(label="◀ 前のページ", style=discord.ButtonStyle.gray, row=1)
-                prev_btn.callback = self.prev_page
-                self.add_item(prev_btn)
-            
-            page_info_btn = discord.ui.Button(
-                label=f"{self.page + 1} / {self.total_pages}ページ",
-                style=discord.ButtonStyle.secondary,
-                disabled=True,
-                row=1
-            )
-            self.add_item(page_info_btn)
-            
-            if self.page < self.total_pages - 1:
-                next_btn = discord.ui.Button(label="次のページ ▶", style=discord.ButtonStyle.gray, row=1)
-                next_btn.callback = self.next_page
-                self.add_item(next_btn)
-        
-        # 完了ボタン
-        done_btn = discord.ui.Button(
-            label=f"✅ 選択完了 ({len(self.parent_view.vc_role_ids)}個)",
-            style=discord.ButtonStyle.green,
-            row=2
+        # メッセージを更新
+        await interaction.edit_original_response(embed=embed, view=self.view)
+
+
+class VCOptionSelectDropdown(discord.ui.Select):
+    """VCオプション選択ドロップダウン"""
+    
+    _OPTIONS = (
+        discord.SelectOption(
+            label=VCOption.TEXT_CHANNEL, 
+            value=VCOption.TEXT_CHANNEL,
+            description="VC参加者のみが見えるテキストチャンネルを作成"
+        ),
+        discord.SelectOption(
+            label=VCOption.NO_CONTROL, 
+            value=VCOption.NO_CONTROL,
+            description="VC作成時に操作パネルを表示しない"
+        ),
+        discord.SelectOption(
+            label=VCOption.HIDE_FULL, 
+            value=VCOption.HIDE_FULL,
+            description="VCが満員になると自動で非表示になる"
+        ),
+        discord.SelectOption(
+            label=VCOption.LOCK_NAME, 
+            value=VCOption.LOCK_NAME,
+            description="VC名を固定（番号で管理）"
+        ),
+        discord.SelectOption(
+            label=VCOption.NO_STATE_CONTROL, 
+            value=VCOption.NO_STATE_CONTROL,
+            description="ロック・非表示・人数制限の操作を消す"
+        ),
+        discord.SelectOption(
+            label=VCOption.NO_JOIN_LEAVE_LOG, 
+            value=VCOption.NO_JOIN_LEAVE_LOG,
+            description="入退室ログを表示しない"
+        ),
+        discord.SelectOption(
+            label=VCOption.NO_OWNERSHIP_TRANSFER, 
+            value=VCOption.NO_OWNERSHIP_TRANSFER,
+            description="管理者譲渡機能を無効化"
         )
-        done_btn.callback = self.done
-        self.add_item(done_btn)
-        
-        # クリアボタン
-        if len(self.parent_view.vc_role_ids) > 0:
-            clear_btn = discord.ui.Button(label="🗑️ 全解除", style=discord.ButtonStyle.danger, row=2)
-            clear_btn.callback = self.clear_all
-            self.add_item(clear_btn)
-    
-    async def prev_page(self, interaction: discord.Interaction):
-        self.page -= 1
-        self.update_components()
-        await interaction.response.edit_message(view=self)
-    
-    async def next_page(self, interaction: discord.Interaction):
-        self.page += 1
-        self.update_components()
-        await interaction.response.edit_message(view=self)
-    
-    async def done(self, interaction: discord.Interaction):
-        await interaction.response.send_message(
-            f"✅ 作成されたVCロールを{len(self.parent_view.vc_role_ids)}個選択しました",
-            ephemeral=True
-        )
-        self.stop()
-    
-    async def clear_all(self, interaction: discord.Interaction):
-        self.parent_view.vc_role_ids = []
-        self.update_components()
-        await interaction.response.edit_message(view=self)
-
-
-class VCRoleSelectDropdown(discord.ui.Select):
-    """作成されたVCロール選択ドロップダウン"""
-    
-    def __init__(self, role_view: VCRoleSelectView, roles: list, start_idx: int):
-        self.role_view = role_view
-        
-        options = []
-        for role in roles:
-            is_selected = role.id in role_view.parent_view.vc_role_ids
-            label = f"{'✓ ' if is_selected else ''}{role.name}"
-            options.append(discord.SelectOption(
-                label=label[:100],
-                value=str(role.id),
-                description=f"ID: {role.id}"[:100]
-            ))
-        
-        super().__init__(
-            placeholder=f"ロールを選択 ({start_idx + 1}～{start_idx + len(roles)})",
-            min_values=1,
-            max_values=1,
-            options=options,
-            row=0
-        )
-    
-    async def callback(self, interaction: discord.Interaction):
-        role_id = int(self.values[0])
-        
-        # トグル処理
-        if role_id in self.role_view.parent_view.vc_role_ids:
-            self.role_view.parent_view.vc_role_ids.remove(role_id)
-        else:
-            self.role_view.parent_view.vc_role_ids.append(role_id)
-        
-        # ビューを更新
-        self.role_view.update_components()
-        await interaction.response.edit_message(view=self.role_view)
-
-
-class VCTypeSelectDropdown(discord.ui.Select):
-    """VCタイプ選択ドロップダウン"""
-    
-    def __init__(self, parent_view: VCSetupView):
-        self.parent_view = parent_view
-        
-        options = [
-            discord.SelectOption(label=VCType.NO_LIMIT, value=VCType.NO_LIMIT, description="基本のVC"),
-            discord.SelectOption(label=VCType.WITH_LIMIT, value=VCType.WITH_LIMIT, description="人数制限付きVC（1～25人）")
-        ]
-        
-        super().__init__(
-            placeholder="人数指定の有無",
-            min_values=0,
-            max_values=1,
-            options=options,
-            row=3
-        )
-    
-    async def callback(self, interaction: discord.Interaction):
-        if len(self.values) > 0:
-            self.parent_view._type_selected = True  # 選択フラグを立てる
-            self.parent_view.vc_type = self.values[0]
-        
-        # 埋め込みを更新して選択内容を表示
-        settings_text = self.parent_view.get_current_settings_text()
-        embed = discord.Embed(
-            title="🎭 VC管理システム セットアップ",
-            description=f"```\n【現在の設定】\n{settings_text}\n```",
-            color=0x5865F2
-        )
-        
-        # メッセージを更新
-        await interaction.response.edit_message(embed=embed, view=self.view)
-
-
-class VCOptionSelectDropdown(discord.ui.Select):
-    """VCオプション選択ドロップダウン"""
+    )
     
     def __init__(self, parent_view: VCSetupView):
         self.parent_view = parent_view
         
-        options = [
-            discord.SelectOption(
-                label=VCOption.TEXT_CHANNEL, 
-                value=VCOption.TEXT_CHANNEL,
-                description="VC参加者のみが見えるテキストチャンネルを作成"
-            ),
-            discord.SelectOption(
-                label=VCOption.NO_CONTROL, 
-                value=VCOption.NO_CONTROL,
-                description="VC作成時に操作パネルを表示しない"
-            ),
-            discord.SelectOption(
-                label=VCOption.HIDE_FULL, 
-                value=VCOption.HIDE_FULL,
-                description="VCが満員になると自動で非表示になる"
-            ),
-            discord.SelectOption(
-                label=VCOption.LOCK_NAME, 
-                value=VCOption.LOCK_NAME,
-                description="VC名を固定（番号で管理）"
-            ),
-            discord.SelectOption(
-                label=VCOption.NO_STATE_CONTROL, 
-                value=VCOption.NO_STATE_CONTROL,
-                description="ロック・非表示・人数制限の操作を消す"
-            ),
-            discord.SelectOption(
-                label=VCOption.NO_JOIN_LEAVE_LOG, 
-                value=VCOption.NO_JOIN_LEAVE_LOG,
-                description="入退室ログを表示しない"
-            ),
-            discord.SelectOption(
-                label=VCOption.NO_OWNERSHIP_TRANSFER, 
-                value=VCOption.NO_OWNERSHIP_TRANSFER,
-                description="管理者譲渡機能を無効化"
-            )
-        ]
+        options = list(self._OPTIONS)
         
-        # デバッグ: オプション数を確認
-        logger.info(f"🔍 VCOptionSelectDropdown初期化: {len(options)}個のオプション")
-        for i, opt in enumerate(options):
-            logger.info(f"  オプション{i+1}: {opt.label} = {opt.value}")
+        # デバッグ: オプション数を確認（DEBUGレベルのときだけ出力）
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 VCOptionSelectDropdown初期化: {len(options)}個のオプション")
         
         super().__init__(
             placeholder="オプションを選択（複数可）",
@@ -2036,15 +2080,13 @@ class VCOptionSelectDropdown(discord.ui.Select):
         
         self.parent_view.selected_options = self.values
         
-        # 次へボタンを有効化
-        for item in self.view.children:
-            if hasattr(item, 'label') and item.label == "次へ":
-                item.disabled = False
-                item.style = discord.ButtonStyle.green
+        # 次へボタンを有効化（ビューが保持している参照を直接使う）
+        self.view.next_btn.disabled = False
+        self.view.next_btn.style = discord.ButtonStyle.green
         
         # 選択内容を埋め込みに表示
         if self.values:
-            selected_text = "\n".join([f"✓ {opt}" for opt in self.values])
+            selected_text = "\n".join(f"✓ {opt}" for opt in self.values)
         else:
             selected_text = "なし"
         
@@ -2058,6 +2100,18 @@ class VCOptionSelectDropdown(discord.ui.Select):
         await interaction.edit_original_response(embed=embed, view=self.view)
 
 
+# 固定名入力欄のテンプレート（CombinedInputModal / LockedNameInputModal で共有）
+# discord.py はモーダル生成時にクラス定義の TextInput を複製するため、
+# 入力状態がユーザー間で共有されることはない
+LOCKED_NAME_TEXT_INPUT = discord.ui.TextInput(
+    label="固定するVC名（空白で初期名のまま固定）",
+    placeholder="例: ゲーム部屋（空白可）",
+    min_length=0,
+    max_length=100,
+    required=False
+)
+
+
 class CombinedInputModal(discord.ui.Modal, title="VC設定を入力"):
     """固定名と人数を同時に入力するモーダル"""
     
@@ -2065,13 +2119,7 @@ class CombinedInputModal(discord.ui.Modal, title="VC設定を入力"):
         super().__init__()
         self.parent_view = parent_view
     
-    name_input = discord.ui.TextInput(
-        label="固定するVC名（空白で初期名のまま固定）",
-        placeholder="例: ゲーム部屋（空白可）",
-        min_length=0,
-        max_length=100,
-        required=False
-    )
+    name_input = LOCKED_NAME_TEXT_INPUT
     
     limit_input = discord.ui.TextInput(
         label="人数制限",
@@ -2098,21 +2146,25 @@ class CombinedInputModal(discord.ui.Modal, title="VC設定を入力"):
             # VC作成
             await interaction.response.defer(ephemeral=True)
             
-            await self.parent_view.cog.create_vc_system(
+            hub_vc = await self.parent_view.cog.create_vc_system(
                 interaction.guild,
                 self.parent_view.vc_type,
                 self.parent_view.user_limit,
-                self.parent_view.hub_role_ids,
-                self.parent_view.vc_role_ids,
-                self.parent_view.hidden_role_ids,
+                tuple(self.parent_view.hub_role_ids),
+                tuple(self.parent_view.vc_role_ids),
+                tuple(self.parent_view.hidden_role_ids),
                 self.parent_view.location_mode,
                 self.parent_view.target_category_id,
                 self.parent_view.source_channel,
-                self.parent_view.selected_options,
-                self.parent_view.locked_name
+                tuple(self.parent_view.selected_options),
+                self.parent_view.locked_name,
+                requested_by=interaction.user.id
             )
+            if hub_vc is None:
+                await interaction.followup.send("作成処理が実行中です", ephemeral=True)
+                return
             
-            await interaction.followup.send("✅ VC管理システムを作成しました", ephemeral=True)
+            await interaction.followup.send(f"✅ VC管理システムを作成しました: {hub_vc.mention}", ephemeral=True)
             self.parent_view.stop()
             
         except ValueError as e:
@@ -2131,13 +2183,7 @@ class LockedNameInputModal(discord.ui.Modal, title="固定名を入力"):
         super().__init__()
         self.parent_view = parent_view
     
-    name_input = discord.ui.TextInput(
-        label="固定するVC名（空白で初期名のまま固定）",
-        placeholder="例: ゲーム部屋（空白可）",
-        min_length=0,
-        max_length=100,
-        required=False
-    )
+    name_input = LOCKED_NAME_TEXT_INPUT
     
     async def on_submit(self, interaction: discord.Interaction):
         name = self.name_input.value.strip()
@@ -2146,21 +2192,25 @@ class LockedNameInputModal(discord.ui.Modal, title="固定名を入力"):
         # VC作成（このモーダルは名前変更制限のみの場合にしか呼ばれない）
         await interaction.response.defer(ephemeral=True)
         
-        await self.parent_view.cog.create_vc_system(
+        hub_vc = await self.parent_view.cog.create_vc_system(
             interaction.guild,
             self.parent_view.vc_type,
             self.parent_view.user_limit,
-            self.parent_view.hub_role_ids,
-            self.parent_view.vc_role_ids,
-            self.parent_view.hidden_role_ids,
+            tuple(self.parent_view.hub_role_ids),
+            tuple(self.parent_view.vc_role_ids),
+            tuple(self.parent_view.hidden_role_ids),
             self.parent_view.location_mode,
             self.parent_view.target_category_id,
             self.parent_view.source_channel,
-            self.parent_view.selected_options,
-            self.parent_view.locked_name
+            tuple(self.parent_view.selected_options),
+            self.parent_view.locked_name,
+            requested_by=interaction.user.id
         )
+        if hub_vc is None:
+            await interaction.followup.send("作成処理が実行中です", ephemeral=True)
+            return
         
-        await interaction.followup.send("✅ VC管理システムを作成しました", ephemeral=True)
+        await interaction.followup.send(f"✅ VC管理システムを作成しました: {hub_vc.mention}", ephemeral=True)
         self.parent_view.stop()
 
 
@@ -2213,7 +2263,7 @@ class CategorySelectView(discord.ui.View):
         self.parent_view = parent_view
         self.guild = guild
         self.page = page
-        self.all_categories = [ch for ch in guild.channels if isinstance(ch, discord.CategoryChannel)]
+        self.all_categories = guild.categories
         
         self.add_item(CategorySelectDropdown(self, guild, page))
         
@@ -2231,8 +2281,8 @@ class CategorySelectDropdown(discord.ui.Select):
     def __init__(self, category_view: CategorySelectView, guild: discord.Guild, page: int):
         self.category_view = category_view
         
-        # サーバー内のカテゴリーを取得（ページングあり）
-        all_categories = [ch for ch in guild.channels if isinstance(ch, discord.CategoryChannel)]
+        # サーバー内のカテゴリーを取得（ページングあり、ビュー側で取得済みのものを使う）
+        all_categories = category_view.all_categories
         start_idx = page * 25
         end_idx = start_idx + 25
         categories = all_categories[start_idx:end_idx]
@@ -2300,6 +2350,30 @@ class CancelButton(discord.ui.Button):
         self.parent_view.stop()
 
 
+# ロール選択・オプション選択画面へ遷移するときの固定埋め込み
+# 送信時に to_dict() されるだけで変更しないため、毎回作らずに共有する
+HUB_ROLE_STEP_EMBED = discord.Embed(
+    title="🎭 ハブ参加権限ロール",
+    description="```\nハブVCに入室できるロールを指定します\n```",
+    color=0x5865F2
+)
+VC_ROLE_STEP_EMBED = discord.Embed(
+    title="🎭 作成VC参加制限ロール",
+    description="```\n作成されたVCに参加できるロールを指定します\n未選択の場合は全員が参加可能です\n```",
+    color=0x5865F2
+)
+HIDDEN_ROLE_STEP_EMBED = discord.Embed(
+    title="👁️ 閲覧可能ロール",
+    description="```\nVCを閲覧できるロールを指定します\n```",
+    color=0x5865F2
+)
+OPTION_STEP_EMBED = discord.Embed(
+    title="⚙️ オプション機能を選択",
+    description="```\n複数指定可能、不要な方はスキップ\n```",
+    color=0x5865F2
+)
+
+
 class CreateButton(discord.ui.Button):
     """次へボタン"""
     
@@ -2311,11 +2385,7 @@ class CreateButton(discord.ui.Button):
         # ロール指定が選択されているかチェック
         if self.parent_view.hub_role_mode == "specify":
             # ハブVCロール選択画面へ
-            embed = discord.Embed(
-                title="🎭 ハブ参加権限ロール",
-                description="```\nハブVCに入室できるロールを指定します\n```",
-                color=0x5865F2
-            )
+            embed = HUB_ROLE_STEP_EMBED
             await interaction.response.send_message(
                 embed=embed,
                 view=HubRoleSelectionView(self.parent_view, interaction.guild),
@@ -2323,11 +2393,7 @@ class CreateButton(discord.ui.Button):
             )
         elif self.parent_view.vc_role_mode == "specify":
             # 作成VCロール選択画面へ
-            embed = discord.Embed(
-                title="🎭 VC参加権限ロール",
-                description="```\n作成されたVCに参加できるロールを指定します\n```",
-                color=0x5865F2
-            )
+            embed = VC_ROLE_STEP_EMBED
             await interaction.response.send_message(
                 embed=embed,
                 view=VCRoleSelectionView(self.parent_view, interaction.guild),
@@ -2335,11 +2401,7 @@ class CreateButton(discord.ui.Button):
             )
         elif self.parent_view.hidden_role_mode == "specify":
             # 閲覧可能ロール選択画面へ
-            embed = discord.Embed(
-                title="👁️ 閲覧可能ロール",
-                description="```\nVCを閲覧できるロールを指定します\n```",
-                color=0x5865F2
-            )
+            embed = HIDDEN_ROLE_STEP_EMBED
             await interaction.response.send_message(
                 embed=embed,
                 view=HiddenRoleSelectionView(self.parent_view, interaction.guild),
@@ -2347,11 +2409,7 @@ class CreateButton(discord.ui.Button):
             )
         else:
             # オプション選択画面へ
-            embed = discord.Embed(
-                title="⚙️ オプション機能を選択",
-                description="```\n複数指定可能、不要な方はスキップ\n```",
-                color=0x5865F2
-            )
+            embed = OPTION_STEP_EMBED
             await interaction.response.send_message(
                 embed=embed,
                 view=VCOptionSelectionView(self.parent_view),
@@ -2359,8 +2417,15 @@ class CreateButton(discord.ui.Button):
             )
 
 
-class HubRoleSelectionView(discord.ui.View):
-    """ハブVCロール選択画面"""
+class RoleSelectionView(discord.ui.View):
+    """ロール選択画面の共通処理（24個ずつのページ切り替え + 次へ/キャンセル）
+
+    各画面のサブクラスでtarget_attrなどのクラス属性と、次へボタンの処理next_stepを定義する
+    """
+    
+    target_attr = ""
+    embed_title = ""
+    embed_intro = ""
     
     def __init__(self, parent_view: VCSetupView, guild: discord.Guild, page: int = 0):
         super().__init__(timeout=300)
@@ -2369,9 +2434,10 @@ class HubRoleSelectionView(discord.ui.View):
         self.page = page
         self.has_selected = False
         
-        # 全ロールを取得（@everyone以外）
-        self.all_roles = [r for r in guild.roles if r.name != "@everyone"]
-        self.total_pages = (len(self.all_roles) + 23) // 24  # 24個ずつ（1つのドロップダウン）
+        # 全ロールを取得（@everyone以外、セットアップ中はキャッシュを再利用）
+        self.all_roles, self.total_pages = parent_view.get_cached_roles(guild)
+        # 範囲外のページ指定は丸める
+        self.page = max(0, min(self.page, self.total_pages - 1))
         
         # 次へボタンを作成（再利用するため先に作成）
         self.next_btn = discord.ui.Button(label="次へ", style=discord.ButtonStyle.gray, row=4, disabled=True)
@@ -2381,45 +2447,64 @@ class HubRoleSelectionView(discord.ui.View):
         self.cancel_btn = discord.ui.Button(label="キャンセル", style=discord.ButtonStyle.red, row=4)
         self.cancel_btn.callback = self.cancel
         
-        # 現在のページのロールを表示
-        self.update_components()
-    
-    def update_components(self):
-        """コンポーネントを更新"""
-        self.clear_items()
+        # 選択内容を表示する埋め込み（説明文だけ差し替えて使い回す）
+        self._embed = discord.Embed(title=self.embed_title, color=0x5865F2)
         
-        # 現在のページのロールを取得（24個）
-        start_idx = self.page * 24
-        end_idx = min(start_idx + 24, len(self.all_roles))
-        page_roles = self.all_roles[start_idx:end_idx]
+        # ロール選択ドロップダウン（ページ切り替えでは作り直さず中身だけ差し替える）
+        self._dropdown: Optional[RoleMultiDropdown] = None
+        if self.all_roles:
+            start_idx, page_roles = self._get_page_roles()
+            self._dropdown = RoleMultiDropdown(self, page_roles, start_idx, 0)
+            self.add_item(self._dropdown)
         
-        # 1つのドロップダウンで24個表示（複数選択可能）
-        if len(page_roles) > 0:
-            self.add_item(HubRoleSelectDropdown(self, page_roles, start_idx))
+        # ページ切り替えボタン（作り直さず有効/無効だけ切り替える）
+        self.prev_btn = discord.ui.Button(label="◀ 前のページ", style=discord.ButtonStyle.gray, row=4, disabled=True)
+        self.prev_btn.callback = self.prev_page
+        self.next_page_btn = discord.ui.Button(label="次のページ ▶", style=discord.ButtonStyle.gray, row=4, disabled=True)
+        self.next_page_btn.callback = self.next_page
         
-        # ページネーションボタン
+        # ページ切り替えボタン、次へボタン、キャンセルボタンの順に追加
         if self.total_pages > 1:
-            if self.page > 0:
-                prev_btn = discord.ui.Button(label="◀ 前のページ", style=discord.ButtonStyle.gray, row=4)
-                prev_btn.callback = self.prev_page
-                self.add_item(prev_btn)
-            
-            if self.page < self.total_pages - 1:
-                next_page_btn = discord.ui.Button(label="次のページ ▶", style=discord.ButtonStyle.gray, row=4)
-                next_page_btn.callback = self.next_page
-                self.add_item(next_page_btn)
-        
-        # 次へボタンとキャンセルボタンを追加
+            self.add_item(self.prev_btn)
+            self.add_item(self.next_page_btn)
         self.add_item(self.next_btn)
         self.add_item(self.cancel_btn)
+        
+        # 現在のページのボタン状態を反映
+        self.update_components()
+    
+    @property
+    def selected_role_ids(self) -> Set[int]:
+        return getattr(self.parent_view, self.target_attr)
+    
+    def _get_page_roles(self) -> Tuple[int, Tuple[discord.Role, ...]]:
+        """現在のページの開始位置とロール（24個）を取得"""
+        start_idx = self.page * 24
+        return start_idx, self.all_roles[start_idx:start_idx + 24]
+    
+    def _refresh_dropdown_options(self):
+        """ドロップダウンの選択肢を現在のページの内容に差し替える"""
+        if self._dropdown is None:
+            return
+        start_idx, page_roles = self._get_page_roles()
+        self._dropdown.set_roles(page_roles, start_idx)
+    
+    def update_components(self):
+        """ページネーションボタンの有効/無効を更新（ボタンとドロップダウンは使い回す）"""
+        self.prev_btn.disabled = self.page <= 0
+        self.next_page_btn.disabled = self.page >= self.total_pages - 1
     
     async def prev_page(self, interaction: discord.Interaction):
-        self.page -= 1
+        # 連打で順序が前後しても範囲外にならないように丸める
+        self.page = max(0, self.page - 1)
+        self._refresh_dropdown_options()
         self.update_components()
         await interaction.response.edit_message(view=self)
     
     async def next_page(self, interaction: discord.Interaction):
-        self.page += 1
+        # 連打で順序が前後しても範囲外にならないように丸める
+        self.page = min(self.total_pages - 1, self.page + 1)
+        self._refresh_dropdown_options()
         self.update_components()
         await interaction.response.edit_message(view=self)
     
@@ -2428,343 +2513,159 @@ class HubRoleSelectionView(discord.ui.View):
         await interaction.response.send_message("❌ セットアップをキャンセルしました", ephemeral=True)
         self.stop()
     
-    async def next_step(self, interaction: discord.Interaction):
-        """次のステップへ"""
-        # 作成VCロール選択が必要か確認
-        if self.parent_view.vc_role_mode == "specify":
-            embed = discord.Embed(
-                title="🎭 作成VC参加制限ロール",
-                description="```\n作成されたVCに参加できるロールを指定します\n未選択の場合は全員が参加可能です\n```",
-                color=0x5865F2
-            )
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    embed=embed,
-                    view=VCRoleSelectionView(self.parent_view, interaction.guild),
-                    ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=embed,
-                    view=VCRoleSelectionView(self.parent_view, interaction.guild),
-                    ephemeral=True
-                )
-        else:
-            # オプション選択へ
-            embed = discord.Embed(
-                title="⚙️ オプション機能を選択",
-                description="```\n複数指定可能、不要な方はスキップ\n```",
-                color=0x5865F2
-            )
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    embed=embed,
-                    view=VCOptionSelectionView(self.parent_view, interaction.guild),
-                    ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=embed,
-                    view=VCOptionSelectionView(self.parent_view, interaction.guild),
-                    ephemeral=True
-                )
+    async def send_option_step(self, interaction: discord.Interaction):
+        """オプション選択画面へ"""
+        embed = OPTION_STEP_EMBED
+        # 同じメッセージを次の画面に差し替える（追加のメッセージ送信をしない）
+        await interaction.response.edit_message(embed=embed, view=VCOptionSelectionView(self.parent_view))
 
 
-class HubRoleMultiDropdown(discord.ui.Select):
-    """ハブVCロール選択ドロップダウン（複数配置用）"""
+class RoleMultiDropdown(discord.ui.Select):
+    """ロール選択ドロップダウン（RoleSelectionView の target_attr に書き込む）"""
     
-    def __init__(self, role_view: HubRoleSelectionView, roles: list, start_idx: int, row: int):
+    def __init__(self, role_view: RoleSelectionView, roles: list, start_idx: int, row: int):
         self.role_view = role_view
+        super().__init__(min_values=0, row=row)
+        self.set_roles(roles, start_idx)
+    
+    def set_roles(self, roles, start_idx: int):
+        """表示するロールを差し替える（ページ切り替え時は同じインスタンスを使い回す）"""
+        selected_role_ids = self.role_view.selected_role_ids
+        parent_view = self.role_view.parent_view
+        short_role_name = parent_view.short_role_name
+        role_option_value = parent_view.role_option_value
         
         options = []
+        # value文字列 → ロールID の対応表（コールバックで毎回int変換しないように保持）
+        self._value_to_id = {}
+        # ロールID → (選択肢, 短縮名)（選択時にラベルだけ書き換えるために保持）
+        self._options_by_id = {}
         for role in roles:
-            is_selected = role.id in role_view.parent_view.hub_role_ids
-            label = f"{'✓ ' if is_selected else ''}{role.name}"
-            options.append(discord.SelectOption(
-                label=label[:100],
-                value=str(role.id),
-                description=f"ID: {role.id}"[:100]
-            ))
+            # ロール名を短く制限（20文字まで、セットアップ中はキャッシュ）
+            role_name = short_role_name(role)
+            label = "✓ " + role_name if role.id in selected_role_ids else role_name
+            value = role_option_value(role)
+            self._value_to_id[value] = role.id
+            option = discord.SelectOption(
+                label=label,
+                value=value
+            )
+            self._options_by_id[role.id] = (option, role_name)
+            options.append(option)
         
-        super().__init__(
-            placeholder=f"ロールを選択 ({start_idx + 1}～{start_idx + len(roles)})",
-            min_values=0,
-            max_values=len(options),
-            options=options,
-            row=row
-        )
+        self.options = options
+        self.max_values = len(options)
+        self.placeholder = f"ロールを選択 ({start_idx + 1}～{start_idx + len(roles)})"
+        # このドロップダウンに表示しているロールID（コールバックで再計算しない）
+        self._role_ids = frozenset(self._value_to_id.values())
     
     async def callback(self, interaction: discord.Interaction):
-        # 選択されたロールIDを取得
-        selected_ids = [int(role_id) for role_id in self.values]
+        role_view = self.role_view
+        chosen_role_ids = role_view.selected_role_ids
         
-        # 現在のドロップダウンのロールIDリストを取得
-        current_dropdown_role_ids = [int(opt.value) for opt in self.options]
+        # 現在のドロップダウンのロールを一旦削除して、新しく選択されたロールを追加
+        chosen_role_ids.difference_update(self._role_ids)
+        chosen_role_ids.update(self._value_to_id[value] for value in self.values)
         
-        # 現在のドロップダウンのロールを一旦削除
-        self.role_view.parent_view.hub_role_ids = [
-            rid for rid in self.role_view.parent_view.hub_role_ids 
-            if rid not in current_dropdown_role_ids
-        ]
-        
-        # 新しく選択されたロールを追加
-        self.role_view.parent_view.hub_role_ids.extend(selected_ids)
+        # チェックマークだけを付け替える（選択肢は作り直さない）
+        for role_id, (option, role_name) in self._options_by_id.items():
+            option.label = "✓ " + role_name if role_id in chosen_role_ids else role_name
         
         # 選択フラグを立てる
-        self.role_view.has_selected = True
+        role_view.has_selected = True
         
         # 次へボタンを有効化
-        self.role_view.next_btn.disabled = False
-        self.role_view.next_btn.style = discord.ButtonStyle.green
+        role_view.next_btn.disabled = False
+        role_view.next_btn.style = discord.ButtonStyle.green
         
-        # 選択されたロール名を取得
-        selected_role_names = []
-        for role_id in self.role_view.parent_view.hub_role_ids:
-            role = self.role_view.guild.get_role(role_id)
-            if role:
-                selected_role_names.append(role.name)
+        # 選択されたロール名を取得（表示する先頭5件だけ解決する）
+        resolved_roles = (role_view.guild.get_role(role_id) for role_id in chosen_role_ids)
+        selected_role_names = [role.name for role in islice((r for r in resolved_roles if r is not None), 5)]
         
         # 埋め込みに選択内容を表示
+        embed = role_view._embed
         if selected_role_names:
-            roles_text = "\n".join([f"✓ {name[:30]}" for name in selected_role_names[:5]])  # 最大5個、30文字まで
-            if len(selected_role_names) > 5:
-                roles_text += f"\n\n... その他 {len(selected_role_names) - 5}個のロール"
+            roles_text = "\n".join(f"✓ {name[:30]}" for name in selected_role_names)  # 最大5個、30文字まで
+            if len(chosen_role_ids) > 5:
+                roles_text += f"\n\n... その他 {len(chosen_role_ids) - 5}個のロール"
             
-            embed = discord.Embed(
-                title="🎭 ハブ参加権限ロール",
-                description=f"```\nハブVCに入室できるロールを指定します\n\n【選択中のロール】\n{roles_text}\n```",
-                color=0x5865F2
-            )
+            embed.description = f"```\n{role_view.embed_intro}\n\n【選択中のロール】\n{roles_text}\n```"
         else:
-            embed = discord.Embed(
-                title="🎭 ハブ参加権限ロール",
-                description="```\nハブVCに入室できるロールを指定します\n\nドロップダウンからロールを選択してください\n```",
-                color=0x5865F2
-            )
+            embed.description = f"```\n{role_view.embed_intro}\n\nドロップダウンからロールを選択してください\n```"
         
         # メッセージを更新
-        await interaction.response.edit_message(embed=embed, view=self.role_view)
+        await interaction.response.edit_message(embed=embed, view=role_view)
 
 
-class VCRoleSelectionView(discord.ui.View):
-    """作成VCロール選択画面"""
-    
-    def __init__(self, parent_view: VCSetupView, guild: discord.Guild, page: int = 0):
-        super().__init__(timeout=300)
-        self.parent_view = parent_view
-        self.guild = guild
-        self.page = page
-        self.has_selected = False
-        
-        # 全ロールを取得（@everyone以外）
-        self.all_roles = [r for r in guild.roles if r.name != "@everyone"]
-        self.total_pages = (len(self.all_roles) + 23) // 24  # 24個ずつ（1つのドロップダウン）
-        
-        # 次へボタンを先に作成（再利用）
-        self.next_btn = discord.ui.Button(label="次へ", style=discord.ButtonStyle.gray, row=4, disabled=True)
-        self.next_btn.callback = self.next_step
-        
-        # キャンセルボタンを先に作成
-        self.cancel_btn = discord.ui.Button(label="キャンセル", style=discord.ButtonStyle.red, row=4)
-        self.cancel_btn.callback = self.cancel
-        
-        # 現在のページのロールを表示
-        self.update_components()
-    
-    def update_components(self):
-        """コンポーネントを更新"""
-        self.clear_items()
-        
-        # 現在のページのロールを取得（24個）
-        start_idx = self.page * 24
-        end_idx = min(start_idx + 24, len(self.all_roles))
-        page_roles = self.all_roles[start_idx:end_idx]
-        
-        # 1つのドロップダウンで24個表示（複数選択可能）
-        if len(page_roles) > 0:
-            self.add_item(VCRoleMultiDropdown(self, page_roles, start_idx, 0))
-        
-        # ページネーションボタン
-        if self.total_pages > 1:
-            if self.page > 0:
-                prev_btn = discord.ui.Button(label="◀ 前のページ", style=discord.ButtonStyle.gray, row=4)
-                prev_btn.callback = self.prev_page
-                self.add_item(prev_btn)
-            
-            if self.page < self.total_pages - 1:
-                next_page_btn = discord.ui.Button(label="次のページ ▶", style=discord.ButtonStyle.gray, row=4)
-                next_page_btn.callback = self.next_page
-                self.add_item(next_page_btn)
-        
-        # 次へボタンとキャンセルボタンを追加
-        self.add_item(self.next_btn)
-        self.add_item(self.cancel_btn)
+class HubRoleSelectionView(RoleSelectionView):
+    """ハブVCロール選択画面"""
     
-    async def prev_page(self, interaction: discord.Interaction):
-        self.page -= 1
-        self.update_components()
-        await interaction.response.edit_message(view=self)
+    target_attr = "hub_role_ids"
+    embed_title = "🎭 ハブ参加権限ロール"
+    embed_intro = "ハブVCに入室できるロールを指定します"
     
-    async def next_page(self, interaction: discord.Interaction):
-        self.page += 1
-        self.update_components()
-        await interaction.response.edit_message(view=self)
+    async def next_step(self, interaction: discord.Interaction):
+        """次のステップへ"""
+        # 作成VCロール選択が必要か確認
+        if self.parent_view.vc_role_mode == "specify":
+            embed = VC_ROLE_STEP_EMBED
+            # 同じメッセージを次の画面に差し替える（追加のメッセージ送信をしない）
+            await interaction.response.edit_message(embed=embed, view=VCRoleSelectionView(self.parent_view, interaction.guild))
+        else:
+            # オプション選択へ
+            await self.send_option_step(interaction)
+
+
+class VCRoleSelectionView(RoleSelectionView):
+    """作成VCロール選択画面"""
     
-    async def cancel(self, interaction: discord.Interaction):
-        """キャンセル"""
-        await interaction.response.send_message("❌ セットアップをキャンセルしました", ephemeral=True)
-        self.stop()
+    target_attr = "vc_role_ids"
+    embed_title = "🎭 作成VC参加制限ロール"
+    embed_intro = "作成されたVCに参加できるロールを指定します"
     
     async def next_step(self, interaction: discord.Interaction):
         """閲覧可能ロール選択またはオプション選択へ"""
         if self.parent_view.hidden_role_mode == "specify":
             # 閲覧可能ロール選択画面へ
-            embed = discord.Embed(
-                title="👁️ 閲覧可能ロール",
-                description="```\nVCを閲覧できるロールを指定します\n```",
-                color=0x5865F2
-            )
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    embed=embed,
-                    view=HiddenRoleSelectionView(self.parent_view, interaction.guild),
-                    ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=embed,
-                    view=HiddenRoleSelectionView(self.parent_view, interaction.guild),
-                    ephemeral=True
-                )
+            embed = HIDDEN_ROLE_STEP_EMBED
+            # 同じメッセージを次の画面に差し替える（追加のメッセージ送信をしない）
+            await interaction.response.edit_message(embed=embed, view=HiddenRoleSelectionView(self.parent_view, interaction.guild))
         else:
             # オプション選択画面へ
-            embed = discord.Embed(
-                title="⚙️ オプション機能を選択",
-                description="```\n複数指定可能、不要な方はスキップ\n```",
-                color=0x5865F2
-            )
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    embed=embed,
-                    view=VCOptionSelectionView(self.parent_view),
-                    ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=embed,
-                    view=VCOptionSelectionView(self.parent_view),
-                    ephemeral=True
-                )
+            await self.send_option_step(interaction)
 
 
-class HiddenRoleSelectionView(discord.ui.View):
+class HiddenRoleSelectionView(RoleSelectionView):
     """閲覧可能ロール選択画面"""
     
-    def __init__(self, parent_view: VCSetupView, guild: discord.Guild, page: int = 0):
+    target_attr = "hidden_role_ids"
+    embed_title = "👁️ 閲覧可能ロール"
+    embed_intro = "VCを閲覧できるロールを指定します"
+    
+    async def next_step(self, interaction: discord.Interaction):
+        """オプション選択へ"""
+        await self.send_option_step(interaction)
+
+
+class VCOptionSelectionView(discord.ui.View):
+    """オプション選択画面"""
+    
+    def __init__(self, parent_view: VCSetupView):
         super().__init__(timeout=300)
         self.parent_view = parent_view
-        self.guild = guild
-        self.page = page
-        self.has_selected = False
-        
-        # 全ロールを取得（@everyone以外）
-        self.all_roles = [r for r in guild.roles if r.name != "@everyone"]
-        self.total_pages = (len(self.all_roles) + 23) // 24  # 24個ずつ（1つのドロップダウン）
         
-        # 次へボタンを先に作成（再利用）
-        self.next_btn = discord.ui.Button(label="次へ", style=discord.ButtonStyle.gray, row=4, disabled=True)
-        self.next_btn.callback = self.next_step
-        
-        # キャンセルボタンを先に作成
-        self.cancel_btn = discord.ui.Button(label="キャンセル", style=discord.ButtonStyle.red, row=4)
-        self.cancel_btn.callback = self.cancel
-        
-        # 現在のページのロールを表示
-        self.update_components()
-    
-    def update_components(self):
-        """コンポーネントを更新"""
-        self.clear_items()
-        
-        # 現在のページのロールを取得（24個）
-        start_idx = self.page * 24
-        end_idx = min(start_idx + 24, len(self.all_roles))
-        page_roles = self.all_roles[start_idx:end_idx]
-        
-        # 1つのドロップダウンで24個表示（複数選択可能）
-        if len(page_roles) > 0:
-            self.add_item(HiddenRoleMultiDropdown(self, page_roles, start_idx, 0))
-        
-        # ページネーションボタン
-        if self.total_pages > 1:
-            if self.page > 0:
-                prev_btn = discord.ui.Button(label="◀ 前のページ", style=discord.ButtonStyle.gray, row=4)
-                prev_btn.callback = self.prev_page
-                self.add_item(prev_btn)
-            
-            if self.page < self.total_pages - 1:
-                next_page_btn = discord.ui.Button(label="次のページ ▶", style=discord.ButtonStyle.gray, row=4)
-                next_page_btn.callback = self.next_page
-                self.add_item(next_page_btn)
-        
-        # 次へボタンとキャンセルボタンを追加
-        self.add_item(self.next_btn)
-        self.add_item(self.cancel_btn)
-    
-    async def prev_page(self, interaction: discord.Interaction):
-        self.page -= 1
-        self.update_components()
-        await interaction.response.edit_message(view=self)
-    
-    async def next_page(self, interaction: discord.Interaction):
-        self.page += 1
-        self.update_components()
-        await interaction.response.edit_message(view=self)
-    
-    async def cancel(self, interaction: discord.Interaction):
-        """キャンセル"""
-        await interaction.response.send_message("❌ セットアップをキャンセルしました", ephemeral=True)
-        self.stop()
-    
-    async def next_step(self, interaction: discord.Interaction):
-        """オプション選択へ"""
-        embed = discord.Embed(
-            title="⚙️ オプション機能を選択",
-            description="```\n複数指定可能、不要な方はスキップ\n```",
-            color=0x5865F2
-        )
-        if interaction.response.is_done():
-            await interaction.followup.send(
-                embed=embed,
-                view=VCOptionSelectionView(self.parent_view),
-                ephemeral=True
-            )
-        else:
-            await interaction.response.send_message(
-                embed=embed,
-                view=VCOptionSelectionView(self.parent_view),
-                ephemeral=True
-            )
-
-
-class VCOptionSelectionView(discord.ui.View):
-    """オプション選択画面"""
-    
-    def __init__(self, parent_view: VCSetupView):
-        super().__init__(timeout=300)
-        self.parent_view = parent_view
-        
-        logger.info("🔍 VCOptionSelectionView初期化開始")
+        logger.debug("🔍 VCOptionSelectionView初期化開始")
         # オプション選択ドロップダウン
         dropdown = VCOptionSelectDropdown(parent_view)
-        logger.info(f"🔍 ドロップダウン作成完了: {len(dropdown.options)}個のオプション")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 ドロップダウン作成完了: %d個のオプション", len(dropdown.options))
         self.add_item(dropdown)
-        logger.info("🔍 VCOptionSelectionView初期化完了")
+        logger.debug("🔍 VCOptionSelectionView初期化完了")
         
         # 次へボタン、スキップボタン、キャンセルボタン
-        next_btn = discord.ui.Button(label="次へ", style=discord.ButtonStyle.gray, row=4, disabled=True)
-        next_btn.callback = self.next_to_category
-        self.add_item(next_btn)
+        self.next_btn = discord.ui.Button(label="次へ", style=discord.ButtonStyle.gray, row=4, disabled=True)
+        self.next_btn.callback = self.next_to_category
+        self.add_item(self.next_btn)
         
         skip_btn = discord.ui.Button(label="スキップ", style=discord.ButtonStyle.primary, row=4)
         skip_btn.callback = self.skip_to_category
@@ -2797,160 +2698,6 @@ class VCOptionSelectionView(discord.ui.View):
         )
 
 
-class VCRoleMultiDropdown(discord.ui.Select):
-    """作成VCロール選択ドロップダウン（複数配置用）"""
-    
-    def __init__(self, role_view: VCRoleSelectionView, roles: list, start_idx: int, row: int):
-        self.role_view = role_view
-        
-        options = []
-        for role in roles:
-            is_selected = role.id in role_view.parent_view.vc_role_ids
-            # ロール名を短く制限（20文字まで）
-            role_name = role.name[:20] if len(role.name) > 20 else role.name
-            label = f"{'✓ ' if is_selected else ''}{role_name}"
-            options.append(discord.SelectOption(
-                label=label,
-                value=str(role.id)
-            ))
-        
-        super().__init__(
-            placeholder=f"ロールを選択 ({start_idx + 1}～{start_idx + len(roles)})",
-            min_values=0,
-            max_values=len(options),
-            options=options,
-            row=row
-        )
-    
-    async def callback(self, interaction: discord.Interaction):
-        # 選択されたロールIDを取得
-        selected_ids = [int(role_id) for role_id in self.values]
-        
-        # 現在のドロップダウンのロールIDリストを取得
-        current_dropdown_role_ids = [int(opt.value) for opt in self.options]
-        
-        # 現在のドロップダウンのロールを一旦削除
-        self.role_view.parent_view.vc_role_ids = [
-            rid for rid in self.role_view.parent_view.vc_role_ids 
-            if rid not in current_dropdown_role_ids
-        ]
-        
-        # 新しく選択されたロールを追加
-        self.role_view.parent_view.vc_role_ids.extend(selected_ids)
-        
-        # 選択フラグを立てる
-        self.role_view.has_selected = True
-        
-        # 次へボタンを有効化
-        self.role_view.next_btn.disabled = False
-        self.role_view.next_btn.style = discord.ButtonStyle.green
-        
-        # 選択されたロール名を取得
-        selected_role_names = []
-        for role_id in self.role_view.parent_view.vc_role_ids:
-            role = self.role_view.guild.get_role(role_id)
-            if role:
-                selected_role_names.append(role.name)
-        
-        # 埋め込みに選択内容を表示
-        if selected_role_names:
-            roles_text = "\n".join([f"✓ {name[:30]}" for name in selected_role_names[:5]])  # 最大5個、30文字まで
-            if len(selected_role_names) > 5:
-                roles_text += f"\n\n... その他 {len(selected_role_names) - 5}個のロール"
-            
-            embed = discord.Embed(
-                title="🎭 作成VC参加制限ロール",
-                description=f"```\n作成されたVCに参加できるロールを指定します\n\n【選択中のロール】\n{roles_text}\n```",
-                color=0x5865F2
-            )
-        else:
-            embed = discord.Embed(
-                title="🎭 作成VC参加制限ロール",
-                description="```\n作成されたVCに参加できるロールを指定します\n\nドロップダウンからロールを選択してください\n```",
-                color=0x5865F2
-            )
-        
-        # ビューを更新（edit_messageを使う）
-        await interaction.response.edit_message(embed=embed, view=self.role_view)
-
-
-class HiddenRoleMultiDropdown(discord.ui.Select):
-    """閲覧可能ロール選択ドロップダウン（複数配置用）"""
-    
-    def __init__(self, role_view: HiddenRoleSelectionView, roles: list, start_idx: int, row: int):
-        self.role_view = role_view
-        
-        options = []
-        for role in roles:
-            is_selected = role.id in role_view.parent_view.hidden_role_ids
-            # ロール名を短く制限（20文字まで）
-            role_name = role.name[:20] if len(role.name) > 20 else role.name
-            label = f"{'✓ ' if is_selected else ''}{role_name}"
-            options.append(discord.SelectOption(
-                label=label,
-                value=str(role.id)
-            ))
-        
-        super().__init__(
-            placeholder=f"ロールを選択 ({start_idx + 1}～{start_idx + len(roles)})",
-            min_values=0,
-            max_values=len(options),
-            options=options,
-            row=row
-        )
-    
-    async def callback(self, interaction: discord.Interaction):
-        # 選択されたロールIDを取得
-        selected_ids = [int(role_id) for role_id in self.values]
-        
-        # 現在のドロップダウンのロールIDリストを取得
-        current_dropdown_role_ids = [int(opt.value) for opt in self.options]
-        
-        # 現在のドロップダウンのロールを一旦削除
-        self.role_view.parent_view.hidden_role_ids = [
-            rid for rid in self.role_view.parent_view.hidden_role_ids 
-            if rid not in current_dropdown_role_ids
-        ]
-        
-        # 新しく選択されたロールを追加
-        self.role_view.parent_view.hidden_role_ids.extend(selected_ids)
-        
-        # 選択フラグを立てる
-        self.role_view.has_selected = True
-        
-        # 次へボタンを有効化
-        self.role_view.next_btn.disabled = False
-        self.role_view.next_btn.style = discord.ButtonStyle.green
-        
-        # 選択されたロール名を取得
-        selected_role_names = []
-        for role_id in self.role_view.parent_view.hidden_role_ids:
-            role = self.role_view.guild.get_role(role_id)
-            if role:
-                selected_role_names.append(role.name)
-        
-        # 埋め込みに選択内容を表示
-        if selected_role_names:
-            roles_text = "\n".join([f"✓ {name[:30]}" for name in selected_role_names[:5]])  # 最大5個、30文字まで
-            if len(selected_role_names) > 5:
-                roles_text += f"\n\n... その他 {len(selected_role_names) - 5}個のロール"
-            
-            embed = discord.Embed(
-                title="👁️ 閲覧可能ロール",
-                description=f"```\nVCを閲覧できるロールを指定します\n\n【選択中のロール】\n{roles_text}\n```",
-                color=0x5865F2
-            )
-        else:
-            embed = discord.Embed(
-                title="👁️ 閲覧可能ロール",
-                description="```\nVCを閲覧できるロールを指定します\n\nドロップダウンからロールを選択してください\n```",
-                color=0x5865F2
-            )
-        
-        # ビューを更新（edit_messageを使う）
-        await interaction.response.edit_message(embed=embed, view=self.role_view)
-
-
 class VCCategorySelectView(discord.ui.View):
     """VC作成用カテゴリー選択ビュー"""
     
@@ -2959,18 +2706,24 @@ class VCCategorySelectView(discord.ui.View):
         self.parent_view = parent_view
         self.guild = guild
         self.page = page
-        self.all_categories = [ch for ch in guild.channels if isinstance(ch, discord.CategoryChannel)]
+        self.all_categories = list(guild.categories)
         self.selected_category = None
+        # ページ番号 → 選択肢（ページを行き来しても作り直さない）
+        self._page_options: dict = {}
         
-        # カテゴリー選択ドロップダウンを追加
-        self.add_item(VCCategorySelectDropdown(self, guild, page))
+        # カテゴリー選択ドロップダウンを追加（ページ切り替え時も使い回す）
+        self._dropdown = VCCategorySelectDropdown(self, page)
+        self.add_item(self._dropdown)
         
-        # ページネーションボタンを追加
+        # ページネーションボタンを追加（端のページでは無効化する）
+        self._prev_page_btn = None
+        self._next_page_btn = None
         if len(self.all_categories) > 25:
-            if page > 0:
-                self.add_item(VCCategoryPrevButton(self))
-            if (page + 1) * 25 < len(self.all_categories):
-                self.add_item(VCCategoryNextButton(self))
+            self._prev_page_btn = VCCategoryPrevButton(self)
+            self._next_page_btn = VCCategoryNextButton(self)
+            self.add_item(self._prev_page_btn)
+            self.add_item(self._next_page_btn)
+            self._update_page_buttons()
         
         # 次へボタンを追加（初期は無効）
         self.next_btn = discord.ui.Button(label="次へ", style=discord.ButtonStyle.secondary, row=4, disabled=True)
@@ -2982,15 +2735,38 @@ class VCCategorySelectView(discord.ui.View):
         cancel_btn.callback = self.cancel
         self.add_item(cancel_btn)
     
+    def _update_page_buttons(self):
+        """現在のページに合わせてページ送りボタンの有効/無効を切り替え"""
+        if self._prev_page_btn is None:
+            return
+        self._prev_page_btn.disabled = self.page <= 0
+        self._next_page_btn.disabled = (self.page + 1) * 25 >= len(self.all_categories)
+    
+    def _refresh(self, new_page: int):
+        """ビューを作り直さずに表示ページを切り替える"""
+        self.page = new_page
+        self._dropdown.set_page(new_page)
+        self._update_page_buttons()
+    
     async def next_step(self, interaction: discord.Interaction):
         """次のステップへ"""
         parent_view = self.parent_view
+        lock_name = VCOption.LOCK_NAME in parent_view.selected_options
+        with_limit = parent_view.vc_type == VCType.WITH_LIMIT
+        
+        # モーダルが不要ならすぐにdeferしてからVC作成（作成処理が3秒を超えても応答切れにならないように）
+        if not lock_name and not with_limit:
+            if not interaction.response.is_done():
+                await interaction.response.defer(ephemeral=True)
+            # 既に応答済みの場合はcreate_vc_systemでfollowupを使う
+            await parent_view.create_vc_system(interaction)
+            return
         
         # カテゴリー選択のドロップダウンでedit_messageを使っているため、
         # 次へボタンでは新しいメッセージとして処理する
         
         # 名前変更制限と人数指定の両方がある場合、統合モーダルを表示
-        if VCOption.LOCK_NAME in parent_view.selected_options and parent_view.vc_type == VCType.WITH_LIMIT:
+        if lock_name and with_limit:
             # モーダルはresponseでしか表示できないので、followupで案内
             if interaction.response.is_done():
                 await interaction.followup.send(
@@ -3006,7 +2782,7 @@ class VCCategorySelectView(discord.ui.View):
             else:
                 await interaction.response.send_modal(CombinedInputModal(parent_view))
         # 名前変更制限のみの場合
-        elif VCOption.LOCK_NAME in parent_view.selected_options:
+        elif lock_name:
             if interaction.response.is_done():
                 await interaction.followup.send(
                     "📝 次のメッセージで名前を入力してください",
@@ -3020,7 +2796,7 @@ class VCCategorySelectView(discord.ui.View):
             else:
                 await interaction.response.send_modal(LockedNameInputModal(parent_view))
         # 人数指定のみの場合
-        elif parent_view.vc_type == VCType.WITH_LIMIT:
+        else:
             if interaction.response.is_done():
                 await interaction.followup.send(
                     "📝 次のメッセージで人数を入力してください",
@@ -3033,16 +2809,6 @@ class VCCategorySelectView(discord.ui.View):
                 )
             else:
                 await interaction.response.send_modal(VCLimitInputModal(parent_view))
-        # それ以外はVC作成
-        else:
-            # deferする（まだ応答していない場合のみ）
-            if not interaction.response.is_done():
-                await interaction.response.defer(ephemeral=True)
-            else:
-                # 既に応答済みの場合は何もしない（create_vc_systemでfollowupを使う）
-                pass
-            
-            await parent_view.create_vc_system(interaction)
     
     async def cancel(self, interaction: discord.Interaction):
         """キャンセル"""
@@ -3053,29 +2819,35 @@ class VCCategorySelectView(discord.ui.View):
 class VCCategorySelectDropdown(discord.ui.Select):
     """VC作成用カテゴリー選択ドロップダウン"""
     
-    def __init__(self, category_view: VCCategorySelectView, guild: discord.Guild, page: int):
+    def __init__(self, category_view: VCCategorySelectView, page: int):
         self.category_view = category_view
         
-        # カテゴリーリストを取得（ページネーション対応）
-        all_categories = [ch for ch in guild.channels if isinstance(ch, discord.CategoryChannel)]
-        start_idx = page * 25
-        end_idx = min(start_idx + 25, len(all_categories))
-        page_categories = all_categories[start_idx:end_idx]
-        
-        options = [
-            discord.SelectOption(label="新しいカテゴリーを作成", value="new", description="「VC管理システム」という名前で作成")
-        ]
-        
-        for category in page_categories:
-            options.append(discord.SelectOption(label=category.name, value=str(category.id)))
-        
         super().__init__(
             placeholder="カテゴリーを選択してください",
             min_values=1,
             max_values=1,
-            options=options,
             row=0
         )
+        self.set_page(page)
+    
+    def set_page(self, page: int):
+        """指定ページのカテゴリーに選択肢を差し替える（一度作ったページの選択肢は使い回す）"""
+        page_options = self.category_view._page_options
+        options = page_options.get(page)
+        if options is None:
+            # ビューが保持しているカテゴリーリストから該当ページを切り出す
+            start_idx = page * 25
+            page_categories = self.category_view.all_categories[start_idx:start_idx + 25]
+            
+            options = [
+                discord.SelectOption(label="新しいカテゴリーを作成", value="new", description="「VC管理システム」という名前で作成")
+            ]
+            
+            for category in page_categories:
+                options.append(discord.SelectOption(label=category.name, value=str(category.id)))
+            page_options[page] = options
+        
+        self.options = options
     
     async def callback(self, interaction: discord.Interaction):
         if self.values[0] == "new":
@@ -3105,9 +2877,8 @@ class VCCategoryPrevButton(discord.ui.Button):
         self.category_view = category_view
     
     async def callback(self, interaction: discord.Interaction):
-        new_page = self.category_view.page - 1
-        new_view = VCCategorySelectView(self.category_view.parent_view, self.category_view.guild, new_page)
-        await interaction.response.edit_message(view=new_view)
+        self.category_view._refresh(self.category_view.page - 1)
+        await interaction.response.edit_message(view=self.category_view)
 
 
 class VCCategoryNextButton(discord.ui.Button):
@@ -3118,9 +2889,8 @@ class VCCategoryNextButton(discord.ui.Button):
         self.category_view = category_view
     
     async def callback(self, interaction: discord.Interaction):
-        new_page = self.category_view.page + 1
-        new_view = VCCategorySelectView(self.category_view.parent_view, self.category_view.guild, new_page)
-        await interaction.response.edit_message(view=new_view)
+        self.category_view._refresh(self.category_view.page + 1)
+        await interaction.response.edit_message(view=self.category_view)
 
 
 
@@ -3132,67 +2902,93 @@ class VCLimitInputModal(discord.ui.Modal, title="人数制限を入力"):
         self.parent_view = parent_view
     
     user_limit_input = discord.ui.TextInput(
-        label="人数制限",
+        label="人数制限（1〜25）",
         placeholder="1から25までの数字を入力してください",
+        style=discord.TextStyle.short,
         min_length=1,
         max_length=2,
         required=True
     )
     
     async def on_submit(self, interaction: discord.Interaction):
+        # 入力チェックやVC作成より先に応答を保留する
+        await interaction.response.defer(ephemeral=True)
+        
+        # 数字かどうかを先に判定してからint変換（isdecimalならint変換は必ず成功する）
+        value = self.user_limit_input.value.strip()
+        if not value.isdecimal():
+            await interaction.followup.send("1から25の数字を入力してください", ephemeral=True)
+            return
+        limit = int(value)
+        if not 1 <= limit <= 25:
+            await interaction.followup.send("1から25の数字を入力してください", ephemeral=True)
+            return
+        
+        self.parent_view.user_limit = limit
+        
+        # VC作成はバックグラウンドで実行（完了通知はfollowupで送る）
+        background_tasks = self.parent_view.cog._background_tasks
+        task = asyncio.create_task(self._create_vc_system(interaction))
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+        self.parent_view.stop()
+    
+    async def _create_vc_system(self, interaction: discord.Interaction):
+        """VC管理システムを作成して結果を通知"""
+        parent_view = self.parent_view
         try:
-            limit = int(self.user_limit_input.value)
-            if limit < 1 or limit > 25:
-                await interaction.response.send_message("1から25の数字を入力してください", ephemeral=True)
-                return
-            
-            self.parent_view.user_limit = limit
-            
-            # VC作成
-            await interaction.response.defer(ephemeral=True)
-            
-            await self.parent_view.cog.create_vc_system(
+            hub_vc = await parent_view.cog.create_vc_system(
                 interaction.guild,
-                self.parent_view.vc_type,
-                self.parent_view.user_limit,
-                self.parent_view.hub_role_ids,
-                self.parent_view.vc_role_ids,
-                self.parent_view.hidden_role_ids,
-                self.parent_view.location_mode,
-                self.parent_view.target_category_id,
-                self.parent_view.source_channel,
-                self.parent_view.selected_options,
-                self.parent_view.locked_name
+                parent_view.vc_type,
+                parent_view.user_limit,
+                tuple(parent_view.hub_role_ids),
+                tuple(parent_view.vc_role_ids),
+                tuple(parent_view.hidden_role_ids),
+                parent_view.location_mode,
+                parent_view.target_category_id,
+                parent_view.source_channel,
+                tuple(parent_view.selected_options),
+                parent_view.locked_name,
+                requested_by=interaction.user.id
             )
-            
-            await interaction.followup.send("✅ VC管理システムを作成しました", ephemeral=True)
-            self.parent_view.stop()
-            
-        except ValueError:
-            await interaction.response.send_message("数字を入力してください", ephemeral=True)
+        except Exception as e:
+            logger.error(f"VC管理システム作成エラー: {e}", exc_info=True)
+            await send_interaction_error(interaction)
+            return
+        if hub_vc is None:
+            await interaction.followup.send("作成処理が実行中です", ephemeral=True)
+            return
+        
+        await interaction.followup.send(f"✅ VC管理システムを作成しました: {hub_vc.mention}", ephemeral=True)
 
 
 class VCNameQuickEditView(discord.ui.View):
-    """VC名クイック編集ビュー"""
+    """VC名クイック編集ビュー（対象VCはボタンが押されたチャンネルから判定）"""
     
-    def __init__(self, vc: discord.VoiceChannel, owner: discord.Member, cog: VCManager):
+    def __init__(self, cog: VCManager):
         super().__init__(timeout=None)
-        self.vc = vc
-        self.owner = owner
         self.cog = cog
     
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """作成者のみ操作可能"""
-        if self.vc.id not in self.cog.active_vcs:
+        vc_data = self.cog.active_vcs.get(interaction.channel_id)
+        if vc_data is None:
             return False
-        if interaction.user.id != self.cog.active_vcs[self.vc.id]['owner_id']:
+        if interaction.user.id != vc_data['owner_id']:
             return False
         return True
     
-    @discord.ui.button(label="VC名変更", style=discord.ButtonStyle.primary)
+    @discord.ui.button(label="VC名変更", style=discord.ButtonStyle.primary, custom_id="vcmgr:quickname")
     async def open_input(self, interaction: discord.Interaction, button: discord.ui.Button):
         """入力モーダルを開く"""
-        await interaction.response.send_modal(VCNameQuickEditModal(self.vc, self.cog))
+        await interaction.response.send_modal(VCNameQuickEditModal(interaction.channel, self.cog))
+
+
+@dataclass(slots=True)
+class VCEditContext:
+    """VC編集用モーダルが参照する対象VCとCog"""
+    vc: discord.VoiceChannel
+    cog: "VCManager"
 
 
 class VCNameQuickEditModal(discord.ui.Modal, title="VC名を入力"):
@@ -3200,8 +2996,7 @@ class VCNameQuickEditModal(discord.ui.Modal, title="VC名を入力"):
     
     def __init__(self, vc: discord.VoiceChannel, cog: VCManager):
         super().__init__()
-        self.vc = vc
-        self.cog = cog
+        self.ctx = VCEditContext(vc, cog)
     
     name_input = discord.ui.TextInput(
         label="入力欄",
@@ -3212,14 +3007,13 @@ class VCNameQuickEditModal(discord.ui.Modal, title="VC名を入力"):
     )
     
     async def on_submit(self, interaction: discord.Interaction):
-        try:
-            new_name = self.name_input.value
-            
-            # VCチャンネル名を変更
-            await self.vc.edit(name=new_name)
-            await interaction.response.send_message(f"VC名を「{new_name}」に変更しました", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"エラーが発生しました: {str(e)}", ephemeral=True)
+        # 名前変更はレート制限で待たされることがあるので先に応答を保留する
+        # （考え中表示は不要なのでthinking=Falseで即座に応答する）
+        await interaction.response.defer(thinking=False)
+        
+        # VCチャンネル名の変更はチャンネルごとのワーカーに任せる（結果はfollowupで通知）
+        ctx = self.ctx
+        ctx.cog.queue_vc_rename(ctx.vc, self.name_input.value, interaction)
 
 
 # ============================================
@@ -3245,33 +3039,27 @@ class VCStateControlView(discord.ui.View):
     @discord.ui.button(label="🔒 鍵をかける", style=discord.ButtonStyle.danger, row=0)
     async def lock_vc(self, interaction: discord.Interaction, button: discord.ui.Button):
         # 全員の接続権限を拒否（許可リストを除く）
-        overwrites = self.vc.overwrites
-        overwrites[self.vc.guild.default_role] = discord.PermissionOverwrite(connect=False)
-        
-        # 許可リストのユーザーは接続可能に
-        for user_id in self.cog.active_vcs[self.vc.id]['allowed_users']:
-            user = self.vc.guild.get_member(user_id)
-            if user:
+        async with self.cog._pending_overwrites(self.vc) as overwrites:
+            overwrites[self.vc.guild.default_role] = discord.PermissionOverwrite(connect=False)
+            
+            # 許可リストのユーザーは接続可能に
+            for user in self.cog._resolve_user_members(self.vc, 'allowed_users'):
                 overwrites[user] = discord.PermissionOverwrite(connect=True)
-        
-        await self.vc.edit(overwrites=overwrites)
         self.cog.active_vcs[self.vc.id]['is_locked'] = True
+        self.cog._mark_active_vc_dirty(self.vc.id)
         await interaction.response.send_message("鍵をかけました", ephemeral=True)
     
     @discord.ui.button(label="🔓 鍵を解除", style=discord.ButtonStyle.success, row=0)
     async def unlock_vc(self, interaction: discord.Interaction, button: discord.ui.Button):
         # 接続権限を復元（BAN中のユーザーを除く）
-        overwrites = self.vc.overwrites
-        overwrites[self.vc.guild.default_role] = discord.PermissionOverwrite(connect=True)
-        
-        # BANユーザーは引き続き接続不可
-        for user_id in self.cog.active_vcs[self.vc.id]['banned_users']:
-            user = self.vc.guild.get_member(user_id)
-            if user:
+        async with self.cog._pending_overwrites(self.vc) as overwrites:
+            overwrites[self.vc.guild.default_role] = discord.PermissionOverwrite(connect=True)
+            
+            # BANユーザーは引き続き接続不可
+            for user in self.cog._resolve_user_members(self.vc, 'banned_users'):
                 overwrites[user] = discord.PermissionOverwrite(connect=False)
-        
-        await self.vc.edit(overwrites=overwrites)
         self.cog.active_vcs[self.vc.id]['is_locked'] = False
+        self.cog._mark_active_vc_dirty(self.vc.id)
         await interaction.response.send_message("鍵を解除しました", ephemeral=True)
     
     @discord.ui.button(label="🔑 鍵許可を追加", style=discord.ButtonStyle.primary, row=1)
@@ -3289,121 +3077,95 @@ class VCStateControlView(discord.ui.View):
             await interaction.response.send_message("鍵許可リストは空です", ephemeral=True)
             return
         
-        user_info = []
-        for user_id in allowed_users:
-            user = interaction.guild.get_member(user_id)
-            if user:
-                user_info.append(f"スクリーンネーム: {user.display_name}\nスクリーンID: {user.name}")
-            else:
-                user_info.append(f"不明なユーザー\nID: {user_id}")
-        
-        if user_info:
-            await interaction.response.send_message(
-                f"**鍵許可リスト:**\n" + "\n\n".join(user_info),
-                ephemeral=True
-            )
-        else:
-            await interaction.response.send_message("鍵許可リストは空です", ephemeral=True)
+        await interaction.response.send_message(
+            "**鍵許可リスト:**\n" + format_user_list(interaction.guild, allowed_users),
+            ephemeral=True
+        )
     
     @discord.ui.button(label="👁️ 表示", style=discord.ButtonStyle.success, row=3)
     async def show_vc(self, interaction: discord.Interaction, button: discord.ui.Button):
         # 現在の権限を保持したまま、view_channelのみ変更
-        overwrites = self.vc.overwrites.copy()
-        
-        # システムデータから閲覧可能ロールを取得
-        system_data = self.cog.active_vcs[self.vc.id].get('system_data', {})
-        hidden_roles = system_data.get('hidden_roles', [])
-        vc_roles = system_data.get('vc_roles', [])
-        
-        # 鍵の状態を取得
-        is_locked = self.cog.active_vcs[self.vc.id].get('is_locked', False)
-        allowed_users = self.cog.active_vcs[self.vc.id].get('allowed_users', [])
-        banned_users = self.cog.active_vcs[self.vc.id].get('banned_users', [])
-        
-        if hidden_roles:
-            # 閲覧可能ロールが設定されている場合
-            # デフォルトは非表示
-            existing_default = overwrites.get(self.vc.guild.default_role, discord.PermissionOverwrite())
-            overwrites[self.vc.guild.default_role] = discord.PermissionOverwrite(
-                view_channel=False,
-                connect=existing_default.connect  # connectは維持
-            )
+        async with self.cog._pending_overwrites(self.vc) as overwrites:
+            vc_data = self.cog.active_vcs[self.vc.id]
+            guild = self.vc.guild
             
-            # 閲覧可能ロールを持つ人は表示
-            for role_id in hidden_roles:
-                role = self.vc.guild.get_role(role_id)
-                if role:
-                    existing = overwrites.get(role, discord.PermissionOverwrite())
-                    overwrites[role] = discord.PermissionOverwrite(
-                        view_channel=True,
-                        connect=existing.connect if existing.connect is not None else True
-                    )
-        else:
-            # 閲覧可能ロールがない場合は全員に表示
-            existing_default = overwrites.get(self.vc.guild.default_role, discord.PermissionOverwrite())
-            overwrites[self.vc.guild.default_role] = discord.PermissionOverwrite(
-                view_channel=True,
-                connect=existing_default.connect  # connectは維持
-            )
-        
-        # 表示許可リストのユーザーも見えるようにする（connectは維持）
-        for user_id in self.cog.active_vcs[self.vc.id].get('view_allowed_users', []):
-            user = self.vc.guild.get_member(user_id)
-            if user:
-                existing = overwrites.get(user, discord.PermissionOverwrite())
-                overwrites[user] = discord.PermissionOverwrite(
-                    view_channel=True,
-                    connect=existing.connect if existing.connect is not None else True
-                )
-        
-        # BANユーザーと鍵の状態を再適用
-        for user_id in banned_users:
-            user = self.vc.guild.get_member(user_id)
-            if user:
-                existing = overwrites.get(user, discord.PermissionOverwrite())
-                overwrites[user] = discord.PermissionOverwrite(
-                    view_channel=existing.view_channel,
-                    connect=False
-                )
-        
-        if is_locked:
-            # 鍵がかかっている場合、許可リスト以外は接続不可
-            for member in self.vc.guild.members:
-                if member.id not in allowed_users and member.id not in banned_users and not member.bot:
-                    existing = overwrites.get(member, discord.PermissionOverwrite())
+            # システムデータから閲覧可能ロールを取得
+            system_data = vc_data.get('system_data', {})
+            hidden_roles = system_data.get('hidden_roles', [])
+            vc_roles = system_data.get('vc_roles', [])
+            
+            # 鍵の状態を取得
+            is_locked = vc_data.get('is_locked', False)
+            allowed_users = vc_data.get('allowed_users', set())
+            banned_users = vc_data.get('banned_users', set())
+            
+            # 既存の権限をその場で更新する（無ければ空の権限を登録してから更新）
+            def overwrite_for(target) -> discord.PermissionOverwrite:
+                return overwrites.setdefault(target, discord.PermissionOverwrite())
+            
+            if hidden_roles:
+                # 閲覧可能ロールが設定されている場合
+                # デフォルトは非表示（connectは維持）
+                overwrite_for(guild.default_role).update(view_channel=False)
+                
+                # 閲覧可能ロールを持つ人は表示
+                for role_id in hidden_roles:
+                    role = guild.get_role(role_id)
+                    if role:
+                        existing = overwrite_for(role)
+                        existing.update(view_channel=True, connect=existing.connect if existing.connect is not None else True)
+            else:
+                # 閲覧可能ロールがない場合は全員に表示（connectは維持）
+                overwrite_for(guild.default_role).update(view_channel=True)
+            
+            # 表示許可リストのユーザーも見えるようにする（connectは維持）
+            for user_id in vc_data.get('view_allowed_users', []):
+                user = guild.get_member(user_id)
+                if user:
+                    existing = overwrite_for(user)
+                    existing.update(view_channel=True, connect=existing.connect if existing.connect is not None else True)
+            
+            # BANユーザーと鍵の状態を再適用
+            for user_id in banned_users:
+                user = guild.get_member(user_id)
+                if user:
+                    overwrite_for(user).update(connect=False)
+            
+            if is_locked:
+                # 鍵がかかっている場合、許可リスト以外は接続不可
+                # 接続を許可するロール（閲覧可能ロール・入室ロールなど）の許可は@everyoneの拒否より
+                # 優先されるので、個別の権限を持つメンバーに加えてそのロールの持ち主も個別に拒否する
+                targets = {target for target in overwrites if isinstance(target, discord.Member)}
+                for target, existing in list(overwrites.items()):
+                    if isinstance(target, discord.Role) and target != guild.default_role and existing.connect:
+                        targets.update(target.members)
+                for member in targets:
+                    if member.id in allowed_users or member.id in banned_users or member.bot:
+                        continue
+                    existing = overwrite_for(member)
                     if existing.view_channel is not False:  # 見える人だけ処理
-                        overwrites[member] = discord.PermissionOverwrite(
-                            view_channel=existing.view_channel,
-                            connect=False
-                        )
-        
-        await self.vc.edit(overwrites=overwrites)
+                        existing.update(connect=False)
         await interaction.response.send_message("チャンネルを表示しました", ephemeral=True)
     
     @discord.ui.button(label="👁️ 非表示", style=discord.ButtonStyle.danger, row=3)
     async def hide_vc(self, interaction: discord.Interaction, button: discord.ui.Button):
         # 現在の権限を保持したまま、view_channelのみ変更
-        overwrites = self.vc.overwrites.copy()
-        
-        # 全員を非表示にする（connectは維持）
-        existing_default = overwrites.get(self.vc.guild.default_role, discord.PermissionOverwrite())
-        overwrites[self.vc.guild.default_role] = discord.PermissionOverwrite(
-            view_channel=False,
-            connect=existing_default.connect  # connectは維持
-        )
-        
-        # 全てのロールとユーザーも非表示にする（connectは維持）
-        for target, perm in list(overwrites.items()):
-            if target != self.vc.guild.me:  # Bot以外
-                overwrites[target] = discord.PermissionOverwrite(
-                    view_channel=False,
-                    connect=perm.connect  # connectは維持
-                )
-        
-        # Botは必ず見える
-        overwrites[self.vc.guild.me] = discord.PermissionOverwrite(view_channel=True, connect=True, manage_channels=True)
-        
-        await self.vc.edit(overwrites=overwrites)
+        async with self.cog._pending_overwrites(self.vc) as overwrites:
+            guild = self.vc.guild
+            bot_member = guild.me
+            
+            # 全員を非表示にする（connectは維持）
+            overwrites.setdefault(guild.default_role, discord.PermissionOverwrite())
+            
+            # 全てのロールとユーザーも非表示にする（connectは維持）
+            # 既存の権限をその場で更新し、既に非表示のものは触らない
+            for target, perm in overwrites.items():
+                if target == bot_member or perm.view_channel is False:
+                    continue
+                perm.update(view_channel=False)
+            
+            # Botは必ず見える
+            overwrites[bot_member] = discord.PermissionOverwrite(view_channel=True, connect=True, manage_channels=True)
         await interaction.response.send_message("チャンネルを非表示にしました", ephemeral=True)
     
     @discord.ui.button(label="👁️ 表示許可を追加", style=discord.ButtonStyle.primary, row=4)
@@ -3421,21 +3183,10 @@ class VCStateControlView(discord.ui.View):
             await interaction.response.send_message("表示許可リストは空です", ephemeral=True)
             return
         
-        user_info = []
-        for user_id in view_allowed_users:
-            user = interaction.guild.get_member(user_id)
-            if user:
-                user_info.append(f"スクリーンネーム: {user.display_name}\nスクリーンID: {user.name}")
-            else:
-                user_info.append(f"不明なユーザー\nID: {user_id}")
-        
-        if user_info:
-            await interaction.response.send_message(
-                f"**表示許可リスト:**\n" + "\n\n".join(user_info),
-                ephemeral=True
-            )
-        else:
-            await interaction.response.send_message("表示許可リストは空です", ephemeral=True)
+        await interaction.response.send_message(
+            "**表示許可リスト:**\n" + format_user_list(interaction.guild, view_allowed_users),
+            ephemeral=True
+        )
 
 
 class VCBanControlView(discord.ui.View):
@@ -3461,335 +3212,212 @@ class VCBanControlView(discord.ui.View):
     @discord.ui.button(label="✅ ブロック解除", style=discord.ButtonStyle.success, row=0)
     async def remove_ban(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.send_modal(VCBanUserModal(self.vc, self.cog, ban=False))
-    
-    @discord.ui.button(label="📋 ブロックリスト表示", style=discord.ButtonStyle.secondary, row=1)
-    async def show_ban_list(self, interaction: discord.Interaction, button: discord.ui.Button):
-        banned_users = self.cog.active_vcs[self.vc.id].get('banned_users', [])
-        if not banned_users:
-            await interaction.response.send_message("ブロックリストは空です", ephemeral=True)
-            return
-        
-        user_info = []
-        for user_id in banned_users:
-            user = interaction.guild.get_member(user_id)
-            if user:
-                user_info.append(f"スクリーンネーム: {user.display_name}\nスクリーンID: {user.name}")
-            else:
-                user_info.append(f"不明なユーザー\nID: {user_id}")
-        
-        await interaction.response.send_message(
-            f"**ブロックリスト:**\n" + "\n\n".join(user_info),
-            ephemeral=True
-        )
-
-
-class VCBanUserModal(discord.ui.Modal, title="スクリーンID入力"):
-    """BANユーザー入力モーダル"""
-    
-    def __init__(self, vc: discord.VoiceChannel, cog: VCManager, ban: bool):
-        super().__init__()
-        self.vc = vc
-        self.cog = cog
-        self.ban = ban
-    
-    user_id_input = discord.ui.TextInput(
-        label="スクリーンID",
-        placeholder="例: taro123",
-        min_length=1,
-        max_length=32,
-        required=True
-    )
-    
-    async def on_submit(self, interaction: discord.Interaction):
-        try:
-            screen_id = self.user_id_input.value.strip()
-            
-            # スクリーンID（name）でユーザーを検索
-            user = None
-            for member in interaction.guild.members:
-                if member.name == screen_id:
-                    user = member
-                    break
-            
-            if not user:
-                await interaction.response.send_message(f"スクリーンID「{screen_id}」のユーザーが見つかりません", ephemeral=True)
-                return
-            
-            user_id = user.id
-            
-            owner_id = self.cog.active_vcs[self.vc.id]['owner_id']
-            
-            if self.ban:
-                # BAN追加
-                if user_id not in self.cog.active_vcs[self.vc.id]['banned_users']:
-                    self.cog.active_vcs[self.vc.id]['banned_users'].append(user_id)
-                
-                # データベースに保存
-                self.cog.db.add_banned_user(owner_id, user_id)
-                
-                # 許可リストからも削除
-                if user_id in self.cog.active_vcs[self.vc.id]['allowed_users']:
-                    self.cog.active_vcs[self.vc.id]['allowed_users'].remove(user_id)
-                
-                overwrites = self.vc.overwrites
-                overwrites[user] = discord.PermissionOverwrite(connect=False)
-                await self.vc.edit(overwrites=overwrites)
-                
-                # VCから強制切断
-                if user in self.vc.members:
-                    try:
-                        await user.move_to(None)
-                    except Exception as e:
-                        logger.warning(f"⚠️ ユーザー切断エラー (User: {user.name}): {e}")
-                
-                await interaction.response.send_message(f"{user.name}をブロックして切断しました", ephemeral=True)
-            else:
-                # BAN解除
-                if user_id in self.cog.active_vcs[self.vc.id]['banned_users']:
-                    self.cog.active_vcs[self.vc.id]['banned_users'].remove(user_id)
-                
-                # データベースから削除
-                self.cog.db.remove_banned_user(owner_id, user_id)
-                
-                overwrites = self.vc.overwrites
-                is_locked = self.cog.active_vcs[self.vc.id].get('is_locked', False)
-                
-                if is_locked:
-                    # 鍵がかかっている場合は接続不可のまま
-                    if user in overwrites:
-                        del overwrites[user]
-                else:
-                    # 鍵がかかっていない場合は接続可能に
-                    if user in overwrites:
-                        del overwrites[user]
-                
-                await self.vc.edit(overwrites=overwrites)
-                await interaction.response.send_message(f"{user.name}のブロックを解除しました", ephemeral=True)
-                
-        except Exception as e:
-            await interaction.response.send_message(f"エラーが発生しました", ephemeral=True)
-
-
-class VCAllowUserModal(discord.ui.Modal, title="許可リストにユーザーを追加"):
-    """許可リスト追加モーダル"""
-    
-    def __init__(self, vc: discord.VoiceChannel, cog: VCManager):
-        super().__init__()
-        self.vc = vc
-        self.cog = cog
-    
-    user_id_input = discord.ui.TextInput(
-        label="スクリーンID",
-        placeholder="例: taro123",
-        min_length=1,
-        max_length=32,
-        required=True
-    )
-    
-    async def on_submit(self, interaction: discord.Interaction):
-        try:
-            screen_id = self.user_id_input.value.strip()
-            
-            # スクリーンID（name）でユーザーを検索
-            user = None
-            for member in interaction.guild.members:
-                if member.name == screen_id:
-                    user = member
-                    break
-            
-            if not user:
-                await interaction.response.send_message(f"スクリーンID「{screen_id}」のユーザーが見つかりません", ephemeral=True)
-                return
-            
-            user_id = user.id
-            
-            # BANリストに含まれている場合は追加不可
-            if user_id in self.cog.active_vcs[self.vc.id]['banned_users']:
-                await interaction.response.send_message(f"{user.name}はブロック中のため許可できません", ephemeral=True)
-                return
-            
-            # 許可リストに追加
-            if user_id not in self.cog.active_vcs[self.vc.id]['allowed_users']:
-                self.cog.active_vcs[self.vc.id]['allowed_users'].append(user_id)
-            
-            # 接続権限を付与
-            overwrites = self.vc.overwrites
-            overwrites[user] = discord.PermissionOverwrite(connect=True)
-            await self.vc.edit(overwrites=overwrites)
-            
-            await interaction.response.send_message(f"{user.name}を許可リストに追加しました", ephemeral=True)
-            
-        except Exception as e:
-            await interaction.response.send_message(f"エラーが発生しました", ephemeral=True)
-
-
-class VCRemoveAllowUserModal(discord.ui.Modal, title="許可リストからユーザーを削除"):
-    """許可リスト削除モーダル"""
-    
-    def __init__(self, vc: discord.VoiceChannel, cog: VCManager):
-        super().__init__()
-        self.vc = vc
-        self.cog = cog
-    
-    user_id_input = discord.ui.TextInput(
-        label="スクリーンID",
-        placeholder="例: taro123",
-        min_length=1,
-        max_length=32,
-        required=True
-    )
-    
-    async def on_submit(self, interaction: discord.Interaction):
-        try:
-            screen_id = self.user_id_input.value.strip()
-            
-            # スクリーンID（name）でユーザーを検索
-            user = None
-            for member in interaction.guild.members:
-                if member.name == screen_id:
-                    user = member
-                    break
-            
-            if not user:
-                await interaction.response.send_message(f"スクリーンID「{screen_id}」のユーザーが見つかりません", ephemeral=True)
-                return
-            
-            user_id = user.id
-            
-            # 許可リストから削除
-            if user_id in self.cog.active_vcs[self.vc.id]['allowed_users']:
-                self.cog.active_vcs[self.vc.id]['allowed_users'].remove(user_id)
-            
-            # 接続権限を削除（鍵がかかっている場合は接続不可に）
-            overwrites = self.vc.overwrites
-            is_locked = self.cog.active_vcs[self.vc.id].get('is_locked', False)
-            
-            if is_locked:
-                # 鍵がかかっている場合は削除（デフォルトの接続不可に戻る）
-                if user in overwrites:
-                    del overwrites[user]
-            else:
-                # 鍵がかかっていない場合も削除（デフォルトの接続可能に戻る）
-                if user in overwrites:
-                    del overwrites[user]
-            
-            await self.vc.edit(overwrites=overwrites)
-            
-            await interaction.response.send_message(f"{user.name}を許可リストから削除しました", ephemeral=True)
-            
-        except Exception as e:
-            await interaction.response.send_message(f"エラーが発生しました", ephemeral=True)
+    
+    @discord.ui.button(label="📋 ブロックリスト表示", style=discord.ButtonStyle.secondary, row=1)
+    async def show_ban_list(self, interaction: discord.Interaction, button: discord.ui.Button):
+        banned_users = self.cog.active_vcs[self.vc.id].get('banned_users', [])
+        if not banned_users:
+            await interaction.response.send_message("ブロックリストは空です", ephemeral=True)
+            return
+        
+        await interaction.response.send_message(
+            "**ブロックリスト:**\n" + format_user_list(interaction.guild, banned_users),
+            ephemeral=True
+        )
 
 
-class VCViewAllowUserModal(discord.ui.Modal, title="表示許可リストにユーザーを追加"):
-    """表示許可リスト追加モーダル"""
+# スクリーンID入力欄のテンプレート（VCScreenIDModalの各モーダルで共有）
+# LOCKED_NAME_TEXT_INPUTと同じく、モーダル生成時に複製されるので入力状態は共有されない
+SCREEN_ID_TEXT_INPUT = discord.ui.TextInput(
+    label="スクリーンID",
+    placeholder="例: taro123",
+    min_length=1,
+    max_length=32,
+    required=True
+)
+
+
+class VCScreenIDModal(discord.ui.Modal):
+    """スクリーンIDでユーザーを指定するモーダルの共通部分
+
+    サブクラスで見つかったユーザーへの処理_apply(interaction, user)を定義する
+    """
     
     def __init__(self, vc: discord.VoiceChannel, cog: VCManager):
         super().__init__()
         self.vc = vc
         self.cog = cog
     
-    user_id_input = discord.ui.TextInput(
-        label="スクリーンID",
-        placeholder="例: taro123",
-        min_length=1,
-        max_length=32,
-        required=True
-    )
+    user_id_input = SCREEN_ID_TEXT_INPUT
+    
+    async def _resolve_user(self, interaction: discord.Interaction) -> Optional[discord.Member]:
+        """入力されたスクリーンID（name）でユーザーを検索（見つからなければ通知してNone）"""
+        screen_id = self.user_id_input.value.strip()
+        user = self.cog._find_by_screen_id(interaction.guild, screen_id)
+        if not user:
+            await interaction.response.send_message(f"スクリーンID「{screen_id}」のユーザーが見つかりません", ephemeral=True)
+        return user
     
     async def on_submit(self, interaction: discord.Interaction):
         try:
-            screen_id = self.user_id_input.value.strip()
-            
-            # スクリーンID（name）でユーザーを検索
-            user = None
-            for member in interaction.guild.members:
-                if member.name == screen_id:
-                    user = member
-                    break
-            
-            if not user:
-                await interaction.response.send_message(f"スクリーンID「{screen_id}」のユーザーが見つかりません", ephemeral=True)
-                return
+            user = await self._resolve_user(interaction)
+            if user:
+                await self._apply(interaction, user)
+        except Exception as e:
+            logger.error(f"スクリーンID入力の処理エラー (VC ID: {self.vc.id}): {e}", exc_info=True)
+            await send_interaction_error(interaction)
+
+
+class VCBanUserModal(VCScreenIDModal, title="スクリーンID入力"):
+    """BANユーザー入力モーダル"""
+    
+    def __init__(self, vc: discord.VoiceChannel, cog: VCManager, ban: bool):
+        super().__init__(vc, cog)
+        self.ban = ban
+    
+    async def _apply(self, interaction: discord.Interaction, user: discord.Member):
+        user_id = user.id
+        vc_data = self.cog.active_vcs[self.vc.id]
+        
+        owner_id = vc_data['owner_id']
+        
+        if self.ban:
+            # BAN追加
+            vc_data['banned_users'].add(user_id)
             
-            user_id = user.id
+            # データベースに保存
+            self.cog.db.add_banned_user(owner_id, user_id)
             
-            # システムデータから閲覧可能ロールを取得
-            system_data = self.cog.active_vcs[self.vc.id].get('system_data', {})
-            hidden_roles = system_data.get('hidden_roles', [])
+            # 許可リストからも削除
+            vc_data['allowed_users'].discard(user_id)
+            self.cog._mark_active_vc_dirty(self.vc.id)
             
-            # 閲覧可能ロールが設定されている場合、そのロールを持っているかチェック
-            if hidden_roles:
-                user_has_role = any(role_id in [r.id for r in user.roles] for role_id in hidden_roles)
-                if user_has_role:
-                    await interaction.response.send_message(
-                        f"{user.name}は既に閲覧可能ロールを持っているため、表示許可リストに追加できません",
-                        ephemeral=True
-                    )
-                    return
+            overwrites = self.vc.overwrites
+            overwrites[user] = discord.PermissionOverwrite(connect=False)
             
-            # 表示許可リストに追加
-            if user_id not in self.cog.active_vcs[self.vc.id]['view_allowed_users']:
-                self.cog.active_vcs[self.vc.id]['view_allowed_users'].append(user_id)
+            if is_member_in_vc(user, self.vc):
+                # 権限の更新とVCからの強制切断を同時に行う
+                edit_result, move_result = await asyncio.gather(
+                    self.cog._apply_overwrites(self.vc, overwrites),
+                    user.move_to(None),
+                    return_exceptions=True
+                )
+                if isinstance(edit_result, Exception):
+                    raise edit_result
+                if isinstance(move_result, Exception):
+                    logger.warning(f"⚠️ ユーザー切断エラー (User: {user.name}): {move_result}")
+            else:
+                await self.cog._apply_overwrites(self.vc, overwrites)
             
-            # 閲覧権限を付与
-            overwrites = self.vc.overwrites
-            overwrites[user] = discord.PermissionOverwrite(view_channel=True, connect=True)
-            await self.vc.edit(overwrites=overwrites)
+            await interaction.response.send_message(f"{user.name}をブロックして切断しました", ephemeral=True)
+        else:
+            # BAN解除
+            vc_data['banned_users'].discard(user_id)
+            self.cog._mark_active_vc_dirty(self.vc.id)
             
-            await interaction.response.send_message(f"{user.name}を表示許可リストに追加しました", ephemeral=True)
+            # データベースから削除
+            self.cog.db.remove_banned_user(owner_id, user_id)
             
-        except Exception as e:
-            await interaction.response.send_message(f"エラーが発生しました", ephemeral=True)
+            # 個別の権限を削除（鍵の状態に応じた@everyoneの権限に戻る）
+            async with self.cog._pending_overwrites(self.vc) as overwrites:
+                overwrites.pop(user, None)
+            await interaction.response.send_message(f"{user.name}のブロックを解除しました", ephemeral=True)
 
 
-class VCRemoveViewAllowUserModal(discord.ui.Modal, title="表示許可リストからユーザーを削除"):
-    """表示許可リスト削除モーダル"""
+class VCAllowUserModal(VCScreenIDModal, title="許可リストにユーザーを追加"):
+    """許可リスト追加モーダル"""
     
-    def __init__(self, vc: discord.VoiceChannel, cog: VCManager):
-        super().__init__()
-        self.vc = vc
-        self.cog = cog
+    async def _apply(self, interaction: discord.Interaction, user: discord.Member):
+        user_id = user.id
+        vc_data = self.cog.active_vcs[self.vc.id]
+        
+        # BANリストに含まれている場合は追加不可
+        if user_id in vc_data['banned_users']:
+            await interaction.response.send_message(f"{user.name}はブロック中のため許可できません", ephemeral=True)
+            return
+        
+        # 許可リストに追加
+        vc_data['allowed_users'].add(user_id)
+        self.cog._mark_active_vc_dirty(self.vc.id)
+        
+        # 接続権限を付与
+        async with self.cog._pending_overwrites(self.vc) as overwrites:
+            overwrites[user] = discord.PermissionOverwrite(connect=True)
+        
+        await interaction.response.send_message(f"{user.name}を許可リストに追加しました", ephemeral=True)
+
+
+class VCRemoveAllowUserModal(VCScreenIDModal, title="許可リストからユーザーを削除"):
+    """許可リスト削除モーダル"""
     
-    user_id_input = discord.ui.TextInput(
-        label="スクリーンID",
-        placeholder="例: taro123",
-        min_length=1,
-        max_length=32,
-        required=True
-    )
+    async def _apply(self, interaction: discord.Interaction, user: discord.Member):
+        user_id = user.id
+        
+        # 許可リストから削除
+        self.cog.active_vcs[self.vc.id]['allowed_users'].discard(user_id)
+        self.cog._mark_active_vc_dirty(self.vc.id)
+        
+        # 接続権限を削除（鍵がかかっている場合は接続不可に）
+        # 鍵がかかっていればデフォルトの接続不可、なければ接続可能に戻る
+        async with self.cog._pending_overwrites(self.vc) as overwrites:
+            overwrites.pop(user, None)
+        
+        await interaction.response.send_message(f"{user.name}を許可リストから削除しました", ephemeral=True)
+
+
+class VCViewAllowUserModal(VCScreenIDModal, title="表示許可リストにユーザーを追加"):
+    """表示許可リスト追加モーダル"""
     
-    async def on_submit(self, interaction: discord.Interaction):
-        try:
-            screen_id = self.user_id_input.value.strip()
-            
-            # スクリーンID（name）でユーザーを検索
-            user = None
-            for member in interaction.guild.members:
-                if member.name == screen_id:
-                    user = member
-                    break
-            
-            if not user:
-                await interaction.response.send_message(f"スクリーンID「{screen_id}」のユーザーが見つかりません", ephemeral=True)
+    async def _apply(self, interaction: discord.Interaction, user: discord.Member):
+        user_id = user.id
+        vc_data = self.cog.active_vcs[self.vc.id]
+        
+        # システムデータから閲覧可能ロールを取得
+        system_data = vc_data.get('system_data', {})
+        hidden_roles = system_data.get('hidden_roles', [])
+        
+        # 閲覧可能ロールが設定されている場合、そのロールを持っているかチェック
+        # （get_roleはメンバーのロールID一覧を二分探索するだけで、全ロールを解決しない）
+        if hidden_roles:
+            user_has_role = any(user.get_role(role_id) for role_id in hidden_roles)
+            if user_has_role:
+                await interaction.response.send_message(
+                    f"{user.name}は既に閲覧可能ロールを持っているため、表示許可リストに追加できません",
+                    ephemeral=True
+                )
                 return
-            
-            user_id = user.id
-            
-            # 表示許可リストから削除
-            if user_id in self.cog.active_vcs[self.vc.id]['view_allowed_users']:
-                self.cog.active_vcs[self.vc.id]['view_allowed_users'].remove(user_id)
-            
-            # 閲覧権限を削除
-            overwrites = self.vc.overwrites
-            
+        
+        # 表示許可リストに追加
+        vc_data['view_allowed_users'].add(user_id)
+        self.cog._mark_active_vc_dirty(self.vc.id)
+        
+        # 閲覧権限を付与
+        async with self.cog._pending_overwrites(self.vc) as overwrites:
+            overwrites[user] = discord.PermissionOverwrite(view_channel=True, connect=True)
+        
+        await interaction.response.send_message(f"{user.name}を表示許可リストに追加しました", ephemeral=True)
+
+
+class VCRemoveViewAllowUserModal(VCScreenIDModal, title="表示許可リストからユーザーを削除"):
+    """表示許可リスト削除モーダル"""
+    
+    async def _apply(self, interaction: discord.Interaction, user: discord.Member):
+        user_id = user.id
+        vc_data = self.cog.active_vcs[self.vc.id]
+        
+        # 表示許可リストから削除
+        vc_data['view_allowed_users'].discard(user_id)
+        self.cog._mark_active_vc_dirty(self.vc.id)
+        
+        # 閲覧権限を削除
+        async with self.cog._pending_overwrites(self.vc) as overwrites:
             # システムデータから閲覧可能ロールを取得
-            system_data = self.cog.active_vcs[self.vc.id].get('system_data', {})
+            system_data = vc_data.get('system_data', {})
             hidden_roles = system_data.get('hidden_roles', [])
             
             if hidden_roles:
                 # 閲覧可能ロールが設定されている場合、そのロールを持っていなければ見えなくする
-                user_has_role = any(role_id in [r.id for r in user.roles] for role_id in hidden_roles)
+                user_has_role = any(user.get_role(role_id) for role_id in hidden_roles)
                 if not user_has_role:
                     # ロールを持っていないので非表示
                     overwrites[user] = discord.PermissionOverwrite(view_channel=False, connect=False)
@@ -3801,13 +3429,8 @@ class VCRemoveViewAllowUserModal(discord.ui.Modal, title="表示許可リスト
                 # 閲覧可能ロールがない場合は削除（デフォルトに戻る）
                 if user in overwrites:
                     del overwrites[user]
-            
-            await self.vc.edit(overwrites=overwrites)
-            
-            await interaction.response.send_message(f"{user.name}を表示許可リストから削除しました", ephemeral=True)
-            
-        except Exception as e:
-            await interaction.response.send_message(f"エラーが発生しました", ephemeral=True)
+        
+        await interaction.response.send_message(f"{user.name}を表示許可リストから削除しました", ephemeral=True)
 
 
 class VCLimitControlView(discord.ui.View):
@@ -3853,31 +3476,34 @@ class VCUserLimitModal(discord.ui.Modal, title="人数制限設定"):
     )
     
     async def on_submit(self, interaction: discord.Interaction):
-        try:
-            limit = int(self.limit_input.value)
-            if limit < 1 or limit > 25:
-                await interaction.response.send_message("1から25の範囲で入力してください", ephemeral=True)
-                return
-            
-            # BOT数をカウント
-            bot_count = sum(1 for m in self.vc.members if m.bot)
-            
-            # BOT数を加算した人数制限を設定
-            adjusted_limit = limit + bot_count
-            
-            # VCデータを更新
-            self.cog.active_vcs[self.vc.id]['original_limit'] = limit
-            self.cog.active_vcs[self.vc.id]['bot_count'] = bot_count
-            
-            await self.vc.edit(user_limit=adjusted_limit)
-            
-            if bot_count > 0:
-                await interaction.response.send_message(f"人数制限を{limit}人に設定しました（BOT {bot_count}体分を加算: 実質{adjusted_limit}人）", ephemeral=True)
-            else:
-                await interaction.response.send_message(f"人数制限を{limit}人に設定しました", ephemeral=True)
-            
-        except ValueError:
+        # 数字かどうかを先に判定してからint変換（isdecimalならint変換は必ず成功する）
+        value = self.limit_input.value.strip()
+        if not value.isdecimal():
             await interaction.response.send_message("数字で入力してください", ephemeral=True)
+            return
+        limit = int(value)
+        if not 1 <= limit <= 25:
+            await interaction.response.send_message("1から25の範囲で入力してください", ephemeral=True)
+            return
+        
+        # BOT数をカウント
+        bot_count = len([m for m in self.vc.members if m.bot])
+        
+        # BOT数を加算した人数制限を設定
+        adjusted_limit = limit + bot_count
+        
+        # VCデータを更新
+        vc_data = self.cog.active_vcs[self.vc.id]
+        vc_data['original_limit'] = limit
+        vc_data['bot_count'] = bot_count
+        self.cog._mark_active_vc_dirty(self.vc.id)
+        
+        await self.vc.edit(user_limit=adjusted_limit)
+        
+        if bot_count > 0:
+            await interaction.response.send_message(f"人数制限を{limit}人に設定しました（BOT {bot_count}体分を加算: 実質{adjusted_limit}人）", ephemeral=True)
+        else:
+            await interaction.response.send_message(f"人数制限を{limit}人に設定しました", ephemeral=True)
 
 
 class VCNameControlView(discord.ui.View):
@@ -3931,6 +3557,13 @@ class VCNameChangeModal(discord.ui.Modal, title="VC名を変更"):
 class ModalTriggerView(discord.ui.View):
     """モーダルを表示するためのトリガービュー"""
     
+    # modal_typeごとに表示するモーダル
+    modal_classes = {
+        "combined": CombinedInputModal,
+        "name": LockedNameInputModal,
+        "limit": VCLimitInputModal,
+    }
+    
     def __init__(self, parent_view: VCSetupView, modal_type: str):
         super().__init__(timeout=300)
         self.parent_view = parent_view
@@ -3938,12 +3571,9 @@ class ModalTriggerView(discord.ui.View):
     
     @discord.ui.button(label="📝 入力する", style=discord.ButtonStyle.primary)
     async def open_modal(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.modal_type == "combined":
-            await interaction.response.send_modal(CombinedInputModal(self.parent_view))
-        elif self.modal_type == "name":
-            await interaction.response.send_modal(LockedNameInputModal(self.parent_view))
-        elif self.modal_type == "limit":
-            await interaction.response.send_modal(VCLimitInputModal(self.parent_view))
+        modal_class = self.modal_classes.get(self.modal_type)
+        if modal_class is not None:
+            await interaction.response.send_modal(modal_class(self.parent_view))
 
 
 class VCOwnershipTransferView(discord.ui.View):
@@ -3983,68 +3613,145 @@ class VCOwnershipTransferModal(discord.ui.Modal, title="権限譲渡"):
         required=True
     )
     
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # ボタンを押してから送信するまでに管理者が変わっていないか再確認
+        vc_data = self.cog.active_vcs.get(self.vc.id)
+        return bool(vc_data and vc_data['owner_id'] == interaction.user.id)
+    
     async def on_submit(self, interaction: discord.Interaction):
         try:
+            # 検索や権限更新に時間がかかっても応答期限を過ぎないよう、先に応答を保留する
+            await interaction.response.defer(ephemeral=True)
+            
             screen_name = self.user_name_input.value.strip()
             
-            # スクリーンネームでユーザーを検索
-            user = None
-            for member in interaction.guild.members:
-                if member.name == screen_name:
-                    user = member
-                    break
+            # スクリーンネームでユーザーを検索（キャッシュに無ければDiscord側で検索）
+            user = await self.cog._search_by_screen_id(interaction.guild, screen_name)
             
             if not user:
-                await interaction.response.send_message(f"スクリーンネーム「{screen_name}」のユーザーが見つかりません", ephemeral=True)
+                await interaction.followup.send(f"スクリーンネーム「{screen_name}」のユーザーが見つかりません", ephemeral=True)
                 return
             
             if user.bot:
-                await interaction.response.send_message("❌ BOTには権限を譲渡できません", ephemeral=True)
+                await interaction.followup.send("❌ BOTには権限を譲渡できません", ephemeral=True)
                 return
             
             # VCに参加しているかチェック
-            if user not in self.vc.members:
-                await interaction.response.send_message(f"❌ {user.mention} はVCに参加していません。\n権限を譲渡するには、対象ユーザーがVCに参加している必要があります。", ephemeral=True)
+            if not is_member_in_vc(user, self.vc):
+                await interaction.followup.send(f"❌ {user.mention} はVCに参加していません。\n権限を譲渡するには、対象ユーザーがVCに参加している必要があります。", ephemeral=True)
                 return
             
             user_id = user.id
             
-            # 権限譲渡
-            old_owner_id = self.cog.active_vcs[self.vc.id]['owner_id']
-            self.cog.active_vcs[self.vc.id]['owner_id'] = user_id
-            
-            # 操作チャンネルの権限を更新
-            control_channel_id = self.cog.active_vcs[self.vc.id].get('control_channel_id')
-            if control_channel_id:
-                control_channel = interaction.guild.get_channel(control_channel_id)
-                if control_channel:
-                    old_owner = interaction.guild.get_member(old_owner_id)
-                    if old_owner:
-                        await control_channel.set_permissions(old_owner, overwrite=None)
-                    await control_channel.set_permissions(user, read_messages=True, send_messages=True)
-                    await control_channel.send(f"{user.mention} 管理権限が譲渡されました")
+            # 同じVCへの譲渡が重ならないように、所有者の確認から権限更新までをVCごとに排他する
+            async with self.cog.vc_transfer_locks.setdefault(self.vc.id, asyncio.Lock()):
+                vc_data = self.cog.active_vcs[self.vc.id]
+                old_owner_id = vc_data['owner_id']
+                
+                # ロック待ちの間に退出時の引継ぎなどで管理者が変わっていれば譲渡しない
+                if old_owner_id != interaction.user.id:
+                    await interaction.followup.send("❌ 管理者ではないため譲渡できません", ephemeral=True)
+                    return
+                
+                # 自分自身への譲渡は何もしない（権限の付け外しをしない）
+                if user_id == old_owner_id:
+                    await interaction.followup.send("既に管理者です", ephemeral=True)
+                    return
+                
+                # 権限譲渡
+                vc_data['owner_id'] = user_id
+                self.cog._mark_active_vc_dirty(self.vc.id)
+                
+                # 操作チャンネルの権限を更新
+                control_channel_id = vc_data.get('control_channel_id')
+                if control_channel_id:
+                    control_channel = interaction.guild.get_channel(control_channel_id)
+                    if control_channel:
+                        # 旧管理者の権限削除と新管理者の権限付与を1回のeditにまとめる
+                        overwrites = control_channel.overwrites
+                        old_owner = interaction.guild.get_member(old_owner_id)
+                        if old_owner:
+                            overwrites.pop(old_owner, None)
+                        overwrites[user] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
+                        await retry_on_rate_limit(lambda: control_channel.edit(overwrites=overwrites), max_retries=2)
+                        # 操作チャンネルへの通知は譲渡した本人への応答を待たせないよう裏で送る
+                        self.cog._send_in_background(control_channel, f"{user.mention} 管理権限が譲渡されました")
             
-            await interaction.response.send_message(f"{user.name}に管理権限を譲渡しました", ephemeral=True)
+            await interaction.followup.send(f"{user.name}に管理権限を譲渡しました", ephemeral=True)
             
+        except KeyError:
+            # 処理中にVCが削除された
+            await send_interaction_error(interaction, "VCが見つかりません")
+        except RateLimited as e:
+            # retry_on_rate_limitが最後の試行でそのまま投げる（HTTPExceptionではない）
+            logger.warning(f"権限譲渡エラー: レート制限 ({e.retry_after}秒) (VC: {self.vc.id})")
+            await send_interaction_error(interaction, "混み合っています。しばらくしてからもう一度お試しください")
+        except discord.Forbidden:
+            logger.error(f"権限譲渡エラー: 権限が不足しています (VC: {self.vc.id})", exc_info=True)
+            await send_interaction_error(interaction, "権限が不足しています")
+        except discord.HTTPException as e:
+            logger.error(f"権限譲渡エラー (HTTP {e.status}): {e}", exc_info=True)
+            if e.status == 429:
+                await send_interaction_error(interaction, "混み合っています。しばらくしてからもう一度お試しください")
+            else:
+                await send_interaction_error(interaction, "Discord APIエラーが発生しました")
         except Exception as e:
-            await interaction.response.send_message(f"エラーが発生しました", ephemeral=True)
+            logger.error(f"権限譲渡エラー: {e}", exc_info=True)
+            await send_interaction_error(interaction, "エラーが発生しました")
 
 
 # ============================================================
 # ステップ式セットアップView（一つずつ方式）
 # ============================================================
 
+SETUP_EMBED_TITLE = "🎭 VC管理システム セットアップ"
+
+# ステップ説明文のテンプレート（{summary}に前のステップの選択内容が入る）
+STEP4_DESCRIPTION_TEMPLATE = "**ステップ 4/9: 入室ロール設定**\n\n{summary}\n作成されたVCに入場できるロールを設定します。"
+STEP5_DESCRIPTION_TEMPLATE = "**ステップ 5/9: 表示対象ロール**\n\n{summary}\nVCを表示する相手を設定します。"
+STEP6_DESCRIPTION_TEMPLATE = "**ステップ 6/9: VCオプション**\n\n{summary}\n作成されるVCに適用するオプションを選択してください。"
+STEP7_DESCRIPTION_TEMPLATE = "**ステップ 7/9: VC作成場所**\n\n作成するVCを配置するカテゴリーを選択してください。\n✅ オプション: **{summary}**"
+
+# 各ステップの固定の選択肢
+# Selectに渡すだけで変更しないため、ビューを作るたびに作らずに共有する
+VC_TYPE_STEP_OPTIONS = [
+    discord.SelectOption(label="人数制限なし", value="no_limit", description="作成されるVCごとの人数制限を設けない"),
+    discord.SelectOption(label="人数制限を付ける", value="with_limit", description="上限人数を決めてVCを作成")
+]
+HUB_ROLE_STEP_OPTIONS = [
+    discord.SelectOption(label="制限なし", value="none", description="誰でもハブVCからVCを作成できる"),
+    discord.SelectOption(label="ロール指定", value="specify", description="指定したロールだけがVCを作成できる")
+]
+VC_ROLE_STEP_OPTIONS = [
+    discord.SelectOption(label="制限なし", value="none", description="作成されたVCに誰でも入室できる"),
+    discord.SelectOption(label="ロール指定", value="specify", description="指定したロールだけが入室できる")
+]
+HIDDEN_ROLE_STEP_OPTIONS = [
+    discord.SelectOption(label="全員に表示", value="none", description="VCを全員に表示"),
+    discord.SelectOption(label="ロール指定", value="specify", description="指定したロールだけに表示")
+]
+VC_OPTION_STEP_OPTIONS = [
+    discord.SelectOption(label="参加者専用チャット", value=VCOption.TEXT_CHANNEL, description="VC参加者専用のテキストチャンネル"),
+    discord.SelectOption(label="操作パネルなし", value=VCOption.NO_CONTROL, description="操作パネルを表示しない"),
+    discord.SelectOption(label="満員時に非表示", value=VCOption.HIDE_FULL, description="満員時にVCを非表示"),
+    discord.SelectOption(label="名前変更制限", value=VCOption.LOCK_NAME, description="VC名を固定"),
+    discord.SelectOption(label="状態操作なし", value=VCOption.NO_STATE_CONTROL, description="ロック等の操作を消す"),
+    discord.SelectOption(label="入退室ログなし", value=VCOption.NO_JOIN_LEAVE_LOG, description="入退室ログを表示しない"),
+    discord.SelectOption(label="管理者譲渡なし", value=VCOption.NO_OWNERSHIP_TRANSFER, description="管理者譲渡機能を無効化"),
+    discord.SelectOption(label="時間指定で削除", value=VCOption.DELAY_DELETE, description="一定時間経過後のみVCを削除")
+]
+DELETE_DELAY_STEP_OPTIONS = [
+    discord.SelectOption(label=label, value=str(value))
+    for value, label in DELETE_DELAY_CHOICES
+]
+
 class VCStep1_Type(discord.ui.View):
     """ステップ1: VCタイプ選択"""
     def __init__(self, cog, original_interaction):
         super().__init__(timeout=300)
         self.cog = cog
         self.original_interaction = original_interaction
-        options = [
-            discord.SelectOption(label="人数制限なし", value="no_limit", description="作成されるVCごとの人数制限を設けない"),
-            discord.SelectOption(label="人数制限を付ける", value="with_limit", description="上限人数を決めてVCを作成")
-        ]
-        self.select = discord.ui.Select(placeholder="人数制限の有無を選択", options=options)
+        self.select = discord.ui.Select(placeholder="人数制限の有無を選択", options=VC_TYPE_STEP_OPTIONS)
         self.select.callback = self.on_select
         self.add_item(self.select)
 
@@ -4057,12 +3764,14 @@ class VCStep1_Type(discord.ui.View):
                 modal = VCUserLimitModal(self.cog, self.original_interaction, vc_type)
                 await interaction.response.send_modal(modal)
             else:
+                await interaction.response.defer()
                 embed = discord.Embed(
-                    title="🎭 VC管理システム セットアップ",
+                    title=SETUP_EMBED_TITLE,
                     description=f"**ステップ 3/9: VC作成権限**\n\n✅ VCタイプ: **{type_text}**\nVCを作成できるユーザーをロールで制限するか選択してください。",
                     color=0x5865F2)
-                view = VCStep3_HubRole(self.cog, self.original_interaction, vc_type, user_limit=0)
-                await interaction.response.edit_message(embed=embed, view=view)
+                view = VCStep3_HubRole(self.cog, self.original_interaction, vc_type, user_limit=0,
+                    filtered_roles=selectable_roles(interaction.guild))
+                await interaction.edit_original_response(embed=embed, view=view)
         except Exception as e:
             logger.error(f"VCタイプ選択エラー: {e}")
 
@@ -4085,11 +3794,12 @@ class VCUserLimitModal(discord.ui.Modal, title="人数制限を入力"):
         self.vc_type = vc_type
 
     async def on_submit(self, interaction: discord.Interaction):
-        try:
-            user_limit = int(self.limit_input.value)
-        except ValueError:
+        # 数字かどうかを先に判定してからint変換（isdecimalならint変換は必ず成功する）
+        raw = self.limit_input.value.strip()
+        if not raw.isdecimal():
             await interaction.response.send_message("❌ 数値を入力してください", ephemeral=True)
             return
+        user_limit = int(raw)
 
         if user_limit < 2 or user_limit > 25:
             await interaction.response.send_message("❌ 人数は2-25の範囲で入力してください", ephemeral=True)
@@ -4097,10 +3807,11 @@ class VCUserLimitModal(discord.ui.Modal, title="人数制限を入力"):
 
         await interaction.response.defer(thinking=False)
         embed = discord.Embed(
-            title="🎭 VC管理システム セットアップ",
+            title=SETUP_EMBED_TITLE,
             description=f"**ステップ 3/9: VC作成権限**\n\n✅ VCタイプ: **人数指定**\n✅ 人数制限: **{user_limit}人**\nVCを作成できるユーザーをロールで制限するか選択してください。",
             color=0x5865F2)
-        view = VCStep3_HubRole(self.cog, self.original_interaction, self.vc_type, user_limit)
+        view = VCStep3_HubRole(self.cog, self.original_interaction, self.vc_type, user_limit,
+            filtered_roles=selectable_roles(interaction.guild))
         await self.original_interaction.edit_original_response(embed=embed, view=view)
 
 
@@ -4128,14 +3839,21 @@ class PaginatedRoleSelectView(discord.ui.View):
         self.title = title
         self.description = description
         self.placeholder = placeholder
-        self.available_roles = [role for role in roles if role and role != guild.default_role]
+        # rolesは@everyoneを除いたもの（selectable_rolesでセットアップ開始時に1回だけ作る）
+        self.available_roles = roles
         self.on_complete = on_complete
         self.on_skip = on_skip
         self.allow_empty_confirm = allow_empty_confirm
         self.color = color
-        self.selected_role_ids: List[int] = []
+        # 選択中のロール（選択順を保持、IDからRoleを引き直さずに表示へ使う）
+        self._selected_roles: dict[int, discord.Role] = {}
+        self._summary_cache: Optional[str] = None
         self.current_page = 0
         self.role_select: Optional[discord.ui.Select] = None
+        self._page_options: dict[int, List[discord.SelectOption]] = {}  # {ページ: 選択肢}（一度作ったページは使い回す）
+        # ページ送りの連打をまとめるための状態（編集中に来たページ変更は最後の1回だけ反映する）
+        self._updating = False
+        self._pending_page: Optional[int] = None
         self.total_pages = max(1, math.ceil(len(self.available_roles) / self.chunk_size)) if self.available_roles else 1
 
         self._build_role_dropdown()
@@ -4168,29 +3886,30 @@ class PaginatedRoleSelectView(discord.ui.View):
             self.next_button.disabled = True
 
     def _build_role_dropdown(self):
-        if self.role_select:
-            self.remove_item(self.role_select)
-            self.role_select = None
-
-        chunk = self._get_current_chunk()
-        if not chunk:
+        """ロール選択ドロップダウンを1つだけ作る（ページ切り替えでは_refresh_role_dropdownで中身を差し替える）"""
+        if not self.available_roles:
             return
-
-        options = [
-            discord.SelectOption(label=role.name[:100], value=str(role.id))
-            for role in chunk
-        ]
-        placeholder = f"{self.placeholder} ({self.current_page + 1}/{self.total_pages})"
-        select = discord.ui.Select(
-            placeholder=placeholder,
-            options=options,
-            min_values=0,
-            max_values=len(options),
-            row=0
-        )
-        select.callback = self._on_select
-        self.role_select = select
-        self.add_item(select)
+        self.role_select = discord.ui.Select(min_values=0, row=0)
+        self.role_select.callback = self._on_select
+        self._refresh_role_dropdown()
+        self.add_item(self.role_select)
+
+    def _refresh_role_dropdown(self):
+        """現在のページの選択肢とプレースホルダーに差し替える"""
+        options = self._get_page_options()
+        self.role_select.options = options
+        self.role_select.placeholder = f"{self.placeholder} ({self.current_page + 1}/{self.total_pages})"
+        self.role_select.max_values = len(options)
+
+    def _get_page_options(self) -> List[discord.SelectOption]:
+        """現在のページの選択肢を取得（ページごとにキャッシュする）"""
+        options = self._page_options.get(self.current_page)
+        if options is None:
+            options = self._page_options[self.current_page] = [
+                discord.SelectOption(label=role.name[:100], value=str(role.id))
+                for role in self._get_current_chunk()
+            ]
+        return options
 
     def _get_current_chunk(self) -> List[discord.Role]:
         if not self.available_roles:
@@ -4200,7 +3919,9 @@ class PaginatedRoleSelectView(discord.ui.View):
         return self.available_roles[start:end]
 
     def build_embed(self) -> discord.Embed:
-        summary = format_role_list(self.guild, self.selected_role_ids)
+        if self._summary_cache is None:
+            self._summary_cache = format_role_names([role.name for role in self._selected_roles.values()])
+        summary = self._summary_cache
         desc = f"{self.description}\n\n**現在の選択:** {summary}"
         embed = discord.Embed(title=self.title, description=desc, color=self.color)
         if self.available_roles:
@@ -4210,102 +3931,114 @@ class PaginatedRoleSelectView(discord.ui.View):
         return embed
 
     async def _go_prev(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         if self.total_pages <= 1:
-            await interaction.response.defer()
             return
         self.current_page = (self.current_page - 1) % self.total_pages
-        self._build_role_dropdown()
-        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+        self._refresh_role_dropdown()
+        await self._edit_page(interaction)
 
     async def _go_next(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         if self.total_pages <= 1:
-            await interaction.response.defer()
             return
         self.current_page = (self.current_page + 1) % self.total_pages
-        self._build_role_dropdown()
-        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+        self._refresh_role_dropdown()
+        await self._edit_page(interaction)
+
+    async def _edit_page(self, interaction: discord.Interaction):
+        """ページ表示を更新（編集中の連打は最新ページだけをまとめて反映する）"""
+        if self._updating:
+            self._pending_page = self.current_page
+            return
+        self._updating = True
+        try:
+            while True:
+                self._pending_page = None
+                await interaction.edit_original_response(embed=self.build_embed(), view=self)
+                if self._pending_page is None:
+                    break
+        finally:
+            self._updating = False
 
     async def _clear_selection(self, interaction: discord.Interaction):
-        self.selected_role_ids.clear()
-        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+        await interaction.response.defer()
+        self._selected_roles.clear()
+        self._summary_cache = None
+        await interaction.edit_original_response(embed=self.build_embed(), view=self)
 
     async def _skip_selection(self, interaction: discord.Interaction):
         if not self.on_skip:
             await interaction.response.send_message("スキップできません", ephemeral=True)
             return
+        await interaction.response.defer()
         await self.on_skip(interaction)
 
     async def _confirm_selection(self, interaction: discord.Interaction):
-        if not self.selected_role_ids and not self.allow_empty_confirm:
+        if not self._selected_roles and not self.allow_empty_confirm:
             await interaction.response.send_message("少なくとも1つのロールを選択してください。", ephemeral=True)
             return
         if not self.on_complete:
             await interaction.response.send_message("次のステップに進めませんでした。", ephemeral=True)
             return
-        await self.on_complete(interaction, list(self.selected_role_ids))
+        await interaction.response.defer()
+        await self.on_complete(interaction, list(self._selected_roles))
 
     async def _on_select(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         updated = False
+        page_roles = {str(role.id): role for role in self._get_current_chunk()}
         for value in getattr(self.role_select, 'values', []):
-            role_id = int(value)
-            if role_id not in self.selected_role_ids:
-                self.selected_role_ids.append(role_id)
+            role = page_roles.get(value)
+            if role and role.id not in self._selected_roles:
+                self._selected_roles[role.id] = role
                 updated = True
         if updated:
-            await interaction.response.edit_message(embed=self.build_embed(), view=self)
-        else:
-            await interaction.response.defer()
+            self._summary_cache = None
+            await interaction.edit_original_response(embed=self.build_embed(), view=self)
 
 class VCStep3_HubRole(discord.ui.View):
     """ステップ3: VC作成権限"""
-    def __init__(self, cog, original_interaction, vc_type, user_limit):
+    def __init__(self, cog, original_interaction, vc_type, user_limit, filtered_roles: List[discord.Role]):
         super().__init__(timeout=300)
         self.cog = cog
         self.original_interaction = original_interaction
         self.vc_type = vc_type
         self.user_limit = user_limit
-        options = [
-            discord.SelectOption(label="制限なし", value="none", description="誰でもハブVCからVCを作成できる"),
-            discord.SelectOption(label="ロール指定", value="specify", description="指定したロールだけがVCを作成できる")]
-        self.select = discord.ui.Select(placeholder="VC作成権限を選択", options=options)
+        self.filtered_roles = filtered_roles
+        self.select = discord.ui.Select(placeholder="VC作成権限を選択", options=HUB_ROLE_STEP_OPTIONS)
         self.select.callback = self.on_select
         self.add_item(self.select)
 
     def _build_next_embed(self, guild: discord.Guild, hub_role_ids: List[int]) -> discord.Embed:
         role_text, count = summarize_role_names(guild, hub_role_ids)
-        if count == 0:
-            summary = "✅ VC作成: **制限なし**"
-        else:
-            summary = f"✅ VC作成: **{role_text}** ({count}件)"
-        description = (
-            "**ステップ 4/9: 入室ロール設定**\n\n"
-            f"{summary}\n"
-            "作成されたVCに入場できるロールを設定します。"
-        )
-        return discord.Embed(title="🎭 VC管理システム セットアップ", description=description, color=0x5865F2)
+        summary = f"✅ VC作成: **{role_text}** ({count}件)" if count else "✅ VC作成: **制限なし**"
+        description = STEP4_DESCRIPTION_TEMPLATE.format(summary=summary)
+        return discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
 
     async def _proceed(self, interaction: discord.Interaction, hub_role_ids: List[int]):
         embed = self._build_next_embed(interaction.guild, hub_role_ids)
-        view = VCStep4_VCRole(self.cog, self.original_interaction, self.vc_type, self.user_limit, hub_role_ids)
-        await interaction.response.edit_message(embed=embed, view=view)
+        view = VCStep4_VCRole(self.cog, self.original_interaction, self.vc_type, self.user_limit, hub_role_ids, self.filtered_roles)
+        await interaction.edit_original_response(embed=embed, view=view)
 
     async def on_select(self, interaction: discord.Interaction):
         try:
+            await interaction.response.defer()
             mode = self.select.values[0]
             if mode == "none":
                 await self._proceed(interaction, [])
                 return
 
             guild = interaction.guild
-            roles = [r for r in guild.roles if r != guild.default_role]
-            if not roles:
+            # @everyone以外のロールが無ければ選択画面を出さない
+            if not self.filtered_roles:
                 await self._proceed(interaction, [])
                 return
 
             async def handle_complete(select_interaction: discord.Interaction, selected_ids: List[int]):
                 valid_ids = [rid for rid in selected_ids if select_interaction.guild.get_role(rid)]
                 if not valid_ids:
-                    await select_interaction.response.send_message("選択したロールが見つかりませんでした。", ephemeral=True)
+                    await select_interaction.followup.send("選択したロールが見つかりませんでした。", ephemeral=True)
                     return
                 await self._proceed(select_interaction, valid_ids)
 
@@ -4314,72 +4047,64 @@ class VCStep3_HubRole(discord.ui.View):
 
             selector_view = PaginatedRoleSelectView(
                 guild=guild,
-                title="🎭 VC管理システム セットアップ",
+                title=SETUP_EMBED_TITLE,
                 description=(
                     "**ステップ 3-2/9: VC作成ロール選択**\n\n"
                     "VCを作成できるロールを選択してください。必要なロールがなければスキップを押してください。"
                 ),
                 placeholder="VCを作成できるロールを選択",
-                roles=roles,
+                roles=self.filtered_roles,
                 on_complete=handle_complete,
                 on_skip=handle_skip
             )
-            await interaction.response.edit_message(embed=selector_view.build_embed(), view=selector_view)
+            await interaction.edit_original_response(embed=selector_view.build_embed(), view=selector_view)
         except Exception as e:
             logger.error(f"ハブVCロール選択エラー: {e}")
 
 
 class VCStep4_VCRole(discord.ui.View):
     """ステップ4: 入室ロール設定"""
-    def __init__(self, cog, original_interaction, vc_type, user_limit, hub_role_ids):
+    def __init__(self, cog, original_interaction, vc_type, user_limit, hub_role_ids, filtered_roles: List[discord.Role]):
         super().__init__(timeout=300)
         self.cog = cog
         self.original_interaction = original_interaction
         self.vc_type = vc_type
         self.user_limit = user_limit
         self.hub_role_ids = hub_role_ids
-        options = [
-            discord.SelectOption(label="制限なし", value="none", description="作成されたVCに誰でも入室できる"),
-            discord.SelectOption(label="ロール指定", value="specify", description="指定したロールだけが入室できる")]
-        self.select = discord.ui.Select(placeholder="入室ロールの制限を選択", options=options)
+        self.filtered_roles = filtered_roles
+        self.select = discord.ui.Select(placeholder="入室ロールの制限を選択", options=VC_ROLE_STEP_OPTIONS)
         self.select.callback = self.on_select
         self.add_item(self.select)
 
     def _build_step5_embed(self, guild: discord.Guild, vc_role_ids: List[int]) -> discord.Embed:
         role_text, count = summarize_role_names(guild, vc_role_ids)
-        if count == 0:
-            summary = "✅ 入場ロール: **制限なし**"
-        else:
-            summary = f"✅ 入場ロール: **{role_text}** ({count}件)"
-        description = (
-            "**ステップ 5/9: 表示対象ロール**\n\n"
-            f"{summary}\n"
-            "VCを表示する相手を設定します。"
-        )
-        return discord.Embed(title="🎭 VC管理システム セットアップ", description=description, color=0x5865F2)
+        summary = f"✅ 入場ロール: **{role_text}** ({count}件)" if count else "✅ 入場ロール: **制限なし**"
+        description = STEP5_DESCRIPTION_TEMPLATE.format(summary=summary)
+        return discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
 
     async def _proceed(self, interaction: discord.Interaction, vc_role_ids: List[int]):
         embed = self._build_step5_embed(interaction.guild, vc_role_ids)
-        view = VCStep5_HiddenRole(self.cog, self.original_interaction, self.vc_type, self.user_limit, self.hub_role_ids, vc_role_ids)
-        await interaction.response.edit_message(embed=embed, view=view)
+        view = VCStep5_HiddenRole(self.cog, self.original_interaction, self.vc_type, self.user_limit, self.hub_role_ids, vc_role_ids, self.filtered_roles)
+        await interaction.edit_original_response(embed=embed, view=view)
 
     async def on_select(self, interaction: discord.Interaction):
         try:
+            await interaction.response.defer()
             mode = self.select.values[0]
             if mode == "none":
                 await self._proceed(interaction, [])
                 return
 
             guild = interaction.guild
-            roles = [r for r in guild.roles if r != guild.default_role]
-            if not roles:
+            # @everyone以外のロールが無ければ選択画面を出さない
+            if not self.filtered_roles:
                 await self._proceed(interaction, [])
                 return
 
             async def handle_complete(select_interaction: discord.Interaction, selected_ids: List[int]):
                 valid_ids = [rid for rid in selected_ids if select_interaction.guild.get_role(rid)]
                 if not valid_ids:
-                    await select_interaction.response.send_message("選択したロールが見つかりませんでした。", ephemeral=True)
+                    await select_interaction.followup.send("選択したロールが見つかりませんでした。", ephemeral=True)
                     return
                 await self._proceed(select_interaction, valid_ids)
 
@@ -4388,24 +4113,24 @@ class VCStep4_VCRole(discord.ui.View):
 
             selector_view = PaginatedRoleSelectView(
                 guild=guild,
-                title="🎭 VC管理システム セットアップ",
+                title=SETUP_EMBED_TITLE,
                 description=(
                     "**ステップ 4-2/9: 入室ロール選択**\n\n"
                     "作成されたVCに入場できるロールを選択してください。必要なロールが無ければスキップできます。"
                 ),
                 placeholder="作成されたVCに入場できるロールを選択",
-                roles=roles,
+                roles=self.filtered_roles,
                 on_complete=handle_complete,
                 on_skip=handle_skip
             )
-            await interaction.response.edit_message(embed=selector_view.build_embed(), view=selector_view)
+            await interaction.edit_original_response(embed=selector_view.build_embed(), view=selector_view)
         except Exception as e:
             logger.error(f"入室ロール設定エラー: {e}")
 
 
 class VCStep5_HiddenRole(discord.ui.View):
     """ステップ5: 表示対象ロール設定"""
-    def __init__(self, cog, original_interaction, vc_type, user_limit, hub_role_ids, vc_role_ids):
+    def __init__(self, cog, original_interaction, vc_type, user_limit, hub_role_ids, vc_role_ids, filtered_roles: List[discord.Role]):
         super().__init__(timeout=300)
         self.cog = cog
         self.original_interaction = original_interaction
@@ -4413,48 +4138,40 @@ class VCStep5_HiddenRole(discord.ui.View):
         self.user_limit = user_limit
         self.hub_role_ids = hub_role_ids
         self.vc_role_ids = vc_role_ids
-        options = [
-            discord.SelectOption(label="全員に表示", value="none", description="VCを全員に表示"),
-            discord.SelectOption(label="ロール指定", value="specify", description="指定したロールだけに表示")]
-        self.select = discord.ui.Select(placeholder="VCを表示する相手を選択", options=options)
+        self.filtered_roles = filtered_roles
+        self.select = discord.ui.Select(placeholder="VCを表示する相手を選択", options=HIDDEN_ROLE_STEP_OPTIONS)
         self.select.callback = self.on_select
         self.add_item(self.select)
 
     def _build_step6_embed(self, guild: discord.Guild, hidden_role_ids: List[int]) -> discord.Embed:
         role_text, count = summarize_role_names(guild, hidden_role_ids)
-        if count == 0:
-            summary = "✅ 表示対象: **全員**"
-        else:
-            summary = f"✅ 表示対象: **{role_text}** ({count}件)"
-        description = (
-            "**ステップ 6/9: VCオプション**\n\n"
-            f"{summary}\n"
-            "作成されるVCに適用するオプションを選択してください。"
-        )
-        return discord.Embed(title="🎭 VC管理システム セットアップ", description=description, color=0x5865F2)
+        summary = f"✅ 表示対象: **{role_text}** ({count}件)" if count else "✅ 表示対象: **全員**"
+        description = STEP6_DESCRIPTION_TEMPLATE.format(summary=summary)
+        return discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
 
     async def _proceed(self, interaction: discord.Interaction, hidden_role_ids: List[int]):
         embed = self._build_step6_embed(interaction.guild, hidden_role_ids)
         view = VCStep6_Options(self.cog, self.original_interaction, self.vc_type, self.user_limit, self.hub_role_ids, self.vc_role_ids, hidden_role_ids)
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.edit_original_response(embed=embed, view=view)
 
     async def on_select(self, interaction: discord.Interaction):
         try:
+            await interaction.response.defer()
             mode = self.select.values[0]
             if mode == "none":
                 await self._proceed(interaction, [])
                 return
 
             guild = interaction.guild
-            roles = [r for r in guild.roles if r != guild.default_role]
-            if not roles:
+            # @everyone以外のロールが無ければ選択画面を出さない
+            if not self.filtered_roles:
                 await self._proceed(interaction, [])
                 return
 
             async def handle_complete(select_interaction: discord.Interaction, selected_ids: List[int]):
                 valid_ids = [rid for rid in selected_ids if select_interaction.guild.get_role(rid)]
                 if not valid_ids:
-                    await select_interaction.response.send_message("選択したロールが見つかりませんでした。", ephemeral=True)
+                    await select_interaction.followup.send("選択したロールが見つかりませんでした。", ephemeral=True)
                     return
                 await self._proceed(select_interaction, valid_ids)
 
@@ -4463,17 +4180,17 @@ class VCStep5_HiddenRole(discord.ui.View):
 
             selector_view = PaginatedRoleSelectView(
                 guild=guild,
-                title="🎭 VC管理システム セットアップ",
+                title=SETUP_EMBED_TITLE,
                 description=(
                     "**ステップ 5-2/9: 表示ロール選択**\n\n"
                     "VCを表示するロールを選択してください。必要なロールが無ければスキップできます。"
                 ),
                 placeholder="VCを表示するロールを選択",
-                roles=roles,
+                roles=self.filtered_roles,
                 on_complete=handle_complete,
                 on_skip=handle_skip
             )
-            await interaction.response.edit_message(embed=selector_view.build_embed(), view=selector_view)
+            await interaction.edit_original_response(embed=selector_view.build_embed(), view=selector_view)
         except Exception as e:
             logger.error(f"表示対象ロール設定エラー: {e}")
 
@@ -4490,19 +4207,9 @@ class VCStep6_Options(discord.ui.View):
         self.vc_role_ids = vc_role_ids
         self.hidden_role_ids = hidden_role_ids
         
-        options = [
-            discord.SelectOption(label="参加者専用チャット", value=VCOption.TEXT_CHANNEL, description="VC参加者専用のテキストチャンネル"),
-            discord.SelectOption(label="操作パネルなし", value=VCOption.NO_CONTROL, description="操作パネルを表示しない"),
-            discord.SelectOption(label="満員時に非表示", value=VCOption.HIDE_FULL, description="満員時にVCを非表示"),
-            discord.SelectOption(label="名前変更制限", value=VCOption.LOCK_NAME, description="VC名を固定"),
-            discord.SelectOption(label="状態操作なし", value=VCOption.NO_STATE_CONTROL, description="ロック等の操作を消す"),
-            discord.SelectOption(label="入退室ログなし", value=VCOption.NO_JOIN_LEAVE_LOG, description="入退室ログを表示しない"),
-            discord.SelectOption(label="管理者譲渡なし", value=VCOption.NO_OWNERSHIP_TRANSFER, description="管理者譲渡機能を無効化"),
-            discord.SelectOption(label="時間指定で削除", value=VCOption.DELAY_DELETE, description="一定時間経過後のみVCを削除")
-        ]
         self.select = discord.ui.Select(
             placeholder="作成されるVCに適用するオプションを選択（複数可・スキップ可）", 
-            min_values=0, max_values=len(options), options=options)
+            min_values=0, max_values=len(VC_OPTION_STEP_OPTIONS), options=VC_OPTION_STEP_OPTIONS)
         self.select.callback = self.on_select
         self.add_item(self.select)
         
@@ -4513,6 +4220,7 @@ class VCStep6_Options(discord.ui.View):
     
     async def on_select(self, interaction: discord.Interaction):
         try:
+            await interaction.response.defer()
             selected_options = self.select.values if self.select.values else []
             await self.proceed(interaction, selected_options)
         except Exception as e:
@@ -4521,6 +4229,7 @@ class VCStep6_Options(discord.ui.View):
     
     async def on_skip(self, interaction: discord.Interaction):
         try:
+            await interaction.response.defer()
             await self.proceed(interaction, [])
         except Exception as e:
             logger.error(f"オプション選択処理エラー(on_skip): {e}", exc_info=True)
@@ -4534,12 +4243,12 @@ class VCStep6_Options(discord.ui.View):
             if VCOption.LOCK_NAME in selected_options:
                 option_text = f"{len(selected_options)}個選択"
                 embed = discord.Embed(
-                    title="🎭 VC管理システム セットアップ",
+                    title=SETUP_EMBED_TITLE,
                     description=f"**ステップ 6-2/9: 固定名入力**\n\n✅ オプション: **{option_text}**",
                     color=0x5865F2)
                 view = VCStep6_LockedName(self.cog, self.original_interaction, self.vc_type, self.user_limit, 
                     self.hub_role_ids, self.vc_role_ids, self.hidden_role_ids, selected_options)
-                await interaction.response.edit_message(embed=embed, view=view)
+                await interaction.edit_original_response(embed=embed, view=view)
             elif need_delay_option:
                 delay_view = VCStep6_DeleteDelay(
                     self.cog,
@@ -4552,7 +4261,7 @@ class VCStep6_Options(discord.ui.View):
                     selected_options,
                     locked_name=None
                 )
-                await interaction.response.edit_message(embed=delay_view.build_embed(), view=delay_view)
+                await interaction.edit_original_response(embed=delay_view.build_embed(), view=delay_view)
             else:
                 # 通知設定画面へ
                 notify_ctx = VCNotifyContext(
@@ -4567,7 +4276,7 @@ class VCStep6_Options(discord.ui.View):
                     locked_name=None
                 )
                 notify_view = VCNotifyEnableView(notify_ctx, VCNotifyConfig())
-                await interaction.response.edit_message(embed=notify_view.build_embed(), view=notify_view)
+                await interaction.edit_original_response(embed=notify_view.build_embed(), view=notify_view)
         except Exception as e:
             logger.error(f"オプション選択エラー: {e}")
 
@@ -4584,6 +4293,8 @@ class VCNotifyContext:
     selected_options: List[str]
     locked_name: Optional[str]
     delete_delay_minutes: Optional[int] = None
+    # 通知先の表示文字列（設定内容ごと）。通知ステップ間で戻っても同じ検索を繰り返さない
+    destination_cache: Dict[tuple, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -4629,7 +4340,12 @@ class VCNotifyBaseView(discord.ui.View):
             delay_text = f"\n⏱ 削除タイマー: **{delay_label}**"
         notify_text = ""
         if self.notify_config.enabled:
-            destination = describe_notify_destination(self.ctx.original_interaction.guild, self.notify_config)
+            config = self.notify_config
+            key = (config.channel_id, config.category_id, config.category_new, config.new_category_name)
+            destination = self.ctx.destination_cache.get(key)
+            if destination is None:
+                destination = describe_notify_destination(self.ctx.original_interaction.guild, config)
+                self.ctx.destination_cache[key] = destination
             notify_text = f"\n🔔 通知先: **{destination}**"
             if self.notify_config.role_id:
                 role = self.ctx.original_interaction.guild.get_role(self.notify_config.role_id)
@@ -4639,15 +4355,8 @@ class VCNotifyBaseView(discord.ui.View):
 
     async def go_to_location_step(self, interaction: discord.Interaction):
         option_text, locked_text, notify_text, delay_text = self._summary_texts()
-        embed = discord.Embed(
-            title="🎭 VC管理システム セットアップ",
-            description=(
-                "**ステップ 7/9: VC作成場所**\n\n"
-                "作成するVCを配置するカテゴリーを選択してください。"
-                f"\n✅ オプション: **{option_text}**{locked_text}{delay_text}{notify_text}"
-            ),
-            color=0x5865F2
-        )
+        description = STEP7_DESCRIPTION_TEMPLATE.format(summary=option_text) + f"{locked_text}{delay_text}{notify_text}"
+        embed = discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
         view = VCStep7_Location(
             self.ctx.cog,
             self.ctx.original_interaction,
@@ -4665,7 +4374,7 @@ class VCNotifyBaseView(discord.ui.View):
             self.notify_config.role_id,
             notify_category_new=self.notify_config.category_new
         )
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.edit_original_response(embed=embed, view=view)
 
 
 class VCNotifyEnableView(VCNotifyBaseView):
@@ -4683,14 +4392,16 @@ class VCNotifyEnableView(VCNotifyBaseView):
             "**ステップ 6-3/9: 通知の有無**\n\n"
             "VCが作成された際に案内メッセージを送信するか選択してください。"
         )
-        return discord.Embed(title="🎭 VC管理システム セットアップ", description=description, color=0x5865F2)
+        return discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
 
     async def enable_notify(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         self.notify_config.enabled = True
         view = VCNotifyChannelView(self.ctx, self.notify_config)
-        await interaction.response.edit_message(embed=view.build_embed(), view=view)
+        await interaction.edit_original_response(embed=view.build_embed(), view=view)
 
     async def disable_notify(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         self.notify_config.enabled = False
         await self.go_to_location_step(interaction)
 
@@ -4706,11 +4417,11 @@ class VCNotifyChannelView(VCNotifyBaseView):
             "**ステップ 6-3/9: 通知チャンネル**\n\n"
             "通知を送信するテキストチャンネルを選択するか、専用カテゴリーを作成してください。"
         )
-        return discord.Embed(title="🎭 VC管理システム セットアップ", description=description, color=0x5865F2)
+        return discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
 
     async def proceed_to_mentions(self, interaction: discord.Interaction):
         view = VCNotifyMentionView(self.ctx, self.notify_config)
-        await interaction.response.edit_message(embed=view.build_embed(), view=view)
+        await interaction.edit_original_response(embed=view.build_embed(), view=view)
 
     async def handle_new_category(self, interaction: discord.Interaction):
         self.notify_config.category_new = True
@@ -4726,6 +4437,7 @@ class VCNotifyChannelSelect(discord.ui.ChannelSelect):
         self.parent_view = parent_view
 
     async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         selected = self.values[0]
         channel_id = getattr(selected, "id", None)
         if channel_id is None:
@@ -4737,7 +4449,7 @@ class VCNotifyChannelSelect(discord.ui.ChannelSelect):
             self.parent_view.notify_config.category_new = False
             await self.parent_view.proceed_to_mentions(interaction)
         else:
-            await interaction.response.send_message("チャンネルの取得に失敗しました", ephemeral=True)
+            await interaction.followup.send("チャンネルの取得に失敗しました", ephemeral=True)
 
 
 class VCNotifyCategoryCreateSelect(discord.ui.Select):
@@ -4749,6 +4461,7 @@ class VCNotifyCategoryCreateSelect(discord.ui.Select):
         self.parent_view = parent_view
 
     async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         await self.parent_view.handle_new_category(interaction)
 
 
@@ -4769,15 +4482,17 @@ class VCNotifyMentionView(VCNotifyBaseView):
             f"通知先: {destination}\n"
             "通知を送信するときにロールをメンションするか選択してください。"
         )
-        return discord.Embed(title="🎭 VC管理システム セットアップ", description=description, color=0x5865F2)
+        return discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
 
     async def choose_none(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         self.notify_config.role_id = None
         await self.go_to_location_step(interaction)
 
     async def choose_role(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         view = VCNotifyRoleView(self.ctx, self.notify_config)
-        await interaction.response.edit_message(embed=view.build_embed(), view=view)
+        await interaction.edit_original_response(embed=view.build_embed(), view=view)
 
 
 class VCNotifyRoleView(VCNotifyBaseView):
@@ -4790,7 +4505,7 @@ class VCNotifyRoleView(VCNotifyBaseView):
             "**ステップ 6-3/9: メンションするロール**\n\n"
             "メンションに使用するロールを1つ選択してください。"
         )
-        return discord.Embed(title="🎭 VC管理システム セットアップ", description=description, color=0x5865F2)
+        return discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
 
     async def finish(self, interaction: discord.Interaction):
         await self.go_to_location_step(interaction)
@@ -4802,6 +4517,7 @@ class VCNotifyRolePicker(discord.ui.RoleSelect):
         self.parent_view = parent_view
 
     async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         role = self.values[0]
         self.parent_view.notify_config.role_id = role.id
         await self.parent_view.finish(interaction)
@@ -4900,13 +4616,9 @@ class VCStep6_DeleteDelay(discord.ui.View):
         self.selected_options = selected_options
         self.locked_name = locked_name
 
-        options = [
-            discord.SelectOption(label=label, value=str(value))
-            for value, label in DELETE_DELAY_CHOICES
-        ]
         self.select = discord.ui.Select(
             placeholder="VCを保持する時間を選択",
-            options=options,
+            options=DELETE_DELAY_STEP_OPTIONS,
             min_values=1,
             max_values=1
         )
@@ -4919,12 +4631,12 @@ class VCStep6_DeleteDelay(discord.ui.View):
             "VCを作成してからどれくらいの時間が経過したら削除できるかを選択してください。\n"
             "指定時間を過ぎるまではユーザーが0人でもVCは残り、時間経過後に空になった時点で削除されます。"
         )
-        return discord.Embed(title="🎭 VC管理システム セットアップ", description=description, color=0x5865F2)
+        return discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
 
     async def on_select(self, interaction: discord.Interaction):
         try:
+            await interaction.response.defer()
             if not self.select.values:
-                await interaction.response.defer()
                 return
             minutes = int(self.select.values[0])
             await self.proceed(interaction, minutes)
@@ -4947,18 +4659,55 @@ class VCStep6_DeleteDelay(discord.ui.View):
                 delete_delay_minutes=minutes
             )
             notify_view = VCNotifyEnableView(notify_ctx, VCNotifyConfig())
-            await interaction.response.edit_message(embed=notify_view.build_embed(), view=notify_view)
+            await interaction.edit_original_response(embed=notify_view.build_embed(), view=notify_view)
         except Exception as e:
             logger.error(f"削除タイマー適用エラー: {e}", exc_info=True)
             await send_interaction_error(interaction)
 
 
+# ユーザー一覧の最大文字数（メッセージ上限2000文字から見出しと省略表示の分を引いたもの）
+USER_LIST_MAX_LENGTH = 1900
+
+
+def format_user_list(guild: discord.Guild, user_ids, max_length: int = USER_LIST_MAX_LENGTH) -> str:
+    """ユーザーIDの一覧を表示用の文字列にする（スクリーンネームとスクリーンID、入りきらない分は件数だけ表示）"""
+    entries = []
+    length = 0
+    for user_id in user_ids:
+        member = guild.get_member(user_id)
+        if member:
+            entry = f"スクリーンネーム: {member.display_name}\nスクリーンID: {member.name}"
+        else:
+            entry = f"不明なユーザー\nID: {user_id}"
+        # 区切りの空行（2文字）を含めて上限を超える場合はそこで打ち切る
+        length += len(entry) + 2
+        if length > max_length:
+            break
+        entries.append(entry)
+    text = "\n\n".join(entries)
+    rest = len(user_ids) - len(entries)
+    if rest:
+        text += f"\n\n…ほか{rest}人"
+    return text
+
+
+def selectable_roles(guild: discord.Guild) -> List[discord.Role]:
+    """セットアップで選択できるロール（@everyone以外）"""
+    default_role = guild.default_role
+    return [role for role in guild.roles if role != default_role]
+
+
 def format_role_list(guild: discord.Guild, role_ids: List[int]) -> str:
     names = []
     for role_id in role_ids or []:
         role = guild.get_role(role_id)
         if role:
             names.append(role.name)
+    return format_role_names(names)
+
+
+def format_role_names(names: List[str]) -> str:
+    """ロール名の一覧を表示用にまとめる（6件以上は先頭5件＋残り件数）"""
     if not names:
         return "なし"
     if len(names) > 5:
@@ -5125,8 +4874,8 @@ class VCFinalConfirm(discord.ui.View):
         self.control_category_new = control_category_new
         self.notify_category_new = notify_category_new
     
-    async def _create_system(self, interaction: discord.Interaction):
-        await self.cog.create_vc_system(
+    async def _create_system(self, interaction: discord.Interaction) -> Optional[discord.VoiceChannel]:
+        return await self.cog.create_vc_system(
             interaction.guild,
             self.vc_type,
             self.user_limit,
@@ -5145,7 +4894,8 @@ class VCFinalConfirm(discord.ui.View):
             notify_category_id=self.notify_category_id,
             notify_role_id=self.notify_role_id,
             notify_category_new=self.notify_category_new,
-            control_category_new=self.control_category_new
+            control_category_new=self.control_category_new,
+            requested_by=interaction.user.id
         )
     
     @discord.ui.button(label="作成", style=discord.ButtonStyle.success)
@@ -5153,14 +4903,18 @@ class VCFinalConfirm(discord.ui.View):
         try:
             if not interaction.response.is_done():
                 await interaction.response.defer(ephemeral=True, thinking=False)
-            await self._create_system(interaction)
+            hub_vc = await self._create_system(interaction)
+            if hub_vc is None:
+                # 連打や別のセットアップ画面から、同じユーザーの作成処理が既に実行中
+                await interaction.followup.send("作成処理が実行中です", ephemeral=True)
+                return
+            # 完了通知は元のメッセージの更新だけで行う（追加のfollowupは送らない）
             success_embed = discord.Embed(
                 title="VC管理システムを作成しました",
-                description="設定は保存されました。",
+                description=f"設定は保存されました。\nハブVC: {hub_vc.mention}",
                 color=0x57F287
             )
             await self.original_interaction.edit_original_response(embed=success_embed, view=None)
-            await interaction.followup.send("VC管理システムを作成しました", ephemeral=True)
         except discord.Forbidden:
             logger.error("VC管理システム作成エラー: 権限が不足しています", exc_info=True)
             await send_interaction_error(interaction, "❌ ボットに必要な権限がありません。チャンネル管理権限を確認してください。")
@@ -5238,7 +4992,7 @@ class VCStep7_Location(discord.ui.View):
         has_control = VCOption.NO_CONTROL not in self.selected_options
         if has_control:
             embed = discord.Embed(
-                title="🎭 VC管理システム セットアップ",
+                title=SETUP_EMBED_TITLE,
                 description=(
                     "**ステップ 9/9: 操作パネルの配置**\n\n"
                     "作成したVCを管理する操作パネルを配置するカテゴリーを選択してください。"
@@ -5392,7 +5146,7 @@ class VCStep8_Category(discord.ui.View):
             "**ステップ 8/9: VC作成先のカテゴリー**\n\n"
             "VCを作成するカテゴリーを選択してください。カテゴリーが多い場合は前後のボタンでページを切り替えられます。"
         )
-        embed = discord.Embed(title="🎭 VC管理システム セットアップ", description=description, color=0x5865F2)
+        embed = discord.Embed(title=SETUP_EMBED_TITLE, description=description, color=0x5865F2)
         if self.categories:
             embed.set_footer(text=f"ページ {self.current_page + 1}/{self.total_pages}")
         else:
@@ -5417,7 +5171,7 @@ class VCStep8_Category(discord.ui.View):
 
     async def _return_to_location_step(self, interaction: discord.Interaction, button: discord.ui.Button):
         embed = discord.Embed(
-            title="🎭 VC管理システム セットアップ",
+            title=SETUP_EMBED_TITLE,
             description=(
                 "**ステップ 7/9: VC作成場所**\n\n"
                 "作成するVCをどのカテゴリーに配置するか選択してください。"
@@ -5459,7 +5213,7 @@ class VCStep8_Category(discord.ui.View):
         has_control = VCOption.NO_CONTROL not in self.selected_options
         if has_control:
             embed = discord.Embed(
-                title="🎭 VC管理システム セットアップ",
+                title=SETUP_EMBED_TITLE,
                 description=(
                     "**ステップ 9/9: 操作パネルの配置**\n\n"
                     "作成したVCを管理する操作パネルを配置するカテゴリーを選択してください。"
@@ -8,6 +8,14 @@ import logging
 logger = logging.getLogger('database')
 logger.setLevel(logging.INFO)
 
+
+def split_ids(value: Optional[str]) -> List[int]:
+    """カンマ区切りのID文字列をintのリストに変換"""
+    if not value:
+        return []
+    return list(map(int, filter(None, value.split(','))))
+
+
 class Database:
     """SQLiteデータベース管理クラス"""
     
@@ -385,9 +393,9 @@ class Database:
                 # カラム名からインデックスを取得
                 row_dict = dict(zip(columns, row))
                 
-                allowed_roles = [int(r) for r in row_dict.get('allowed_roles', '').split(',') if r]
-                vc_roles = [int(r) for r in row_dict.get('vc_roles', '').split(',') if r]
-                hidden_roles = [int(r) for r in row_dict.get('hidden_roles', '').split(',') if r]
+                allowed_roles = split_ids(row_dict.get('allowed_roles'))
+                vc_roles = split_ids(row_dict.get('vc_roles'))
+                hidden_roles = split_ids(row_dict.get('hidden_roles'))
                 options = row_dict.get('options', '').split(',') if row_dict.get('options') else []
                 locked_name = row_dict.get('locked_name')
                 
@@ -478,9 +486,9 @@ class Database:
             for row in results:
                 row_dict = dict(zip(columns, row))
                 
-                banned_users = [int(u) for u in row_dict.get('banned_users', '').split(',') if u]
-                allowed_users = [int(u) for u in row_dict.get('allowed_users', '').split(',') if u]
-                view_allowed_users = [int(u) for u in row_dict.get('view_allowed_users', '').split(',') if u]
+                banned_users = split_ids(row_dict.get('banned_users'))
+                allowed_users = split_ids(row_dict.get('allowed_users'))
+                view_allowed_users = split_ids(row_dict.get('view_allowed_users'))
                 options = row_dict.get('options', '').split(',') if row_dict.get('options') else []
                 
                 # delete_delay_minutesが文字列の場合は整数に変換